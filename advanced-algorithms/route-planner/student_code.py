@@ -1,6 +1,14 @@
 import heapq
+import math
+import weakref
+from itertools import chain
 from typing import Optional
 
+try:
+    import numpy as np
+except ImportError:  # The arrays are then built as plain lists
+    np = None
+
 from helpers import Map
 
 def heuristic(a: tuple[float, float], b: tuple[float, float]) -> float:
@@ -14,20 +22,153 @@ def heuristic(a: tuple[float, float], b: tuple[float, float]) -> float:
     Returns:
         float: The Euclidean distance between the two points.
     """
-    pass
+    return math.hypot(a[0] - b[0], a[1] - b[1])
 
-def reconstruct_path(came_from: dict[int, int], current: int) -> list[int]:
+def reconstruct_path(came_from: list[int], current: int) -> list[int]:
     """
     Reconstruct the path from the start node to the goal node.
 
     Args:
-        came_from (dict[int, int]): A dictionary mapping each node to the node it came from.
+        came_from (list[int]): The node each node came from, indexed by node, or -1 for the start node.
         current (int): The goal node.
 
     Returns:
         list[int]: The reconstructed path from the start node to the goal node.
     """
-    pass
+    path = [current]
+    while came_from[current] != -1:
+        current = came_from[current]
+        path.append(current)
+    path.reverse()
+    return path
+
+class CompiledMap:
+    """
+    A map flattened into arrays, so that repeated searches avoid dictionary
+    lookups and recomputing road lengths.
+
+    Intersections keep their numbers 0 to n - 1 from `Map.roads`. The roads are
+    stored in compressed sparse row (CSR) form: the roads leaving intersection
+    i go to `targets[offsets[i]:offsets[i + 1]]`, and `lengths` holds the
+    length of each of those roads. The arrays are NumPy arrays when NumPy is
+    installed and lists otherwise; the search itself reads list copies, since
+    indexing a list one element at a time is faster than indexing an array.
+
+    Attributes:
+        x (np.ndarray): The x coordinate of each intersection.
+        y (np.ndarray): The y coordinate of each intersection.
+        offsets (np.ndarray): Where each intersection's roads start in `targets`, plus the total.
+        targets (np.ndarray): The intersection at the far end of each road.
+        lengths (np.ndarray): The Euclidean length of each road.
+    """
+    def __init__(self, M: Map) -> None:
+        """
+        Build the arrays for a map.
+
+        Args:
+            M (Map): The map to compile.
+        """
+        count = len(M.roads)
+        if np is not None:
+            degrees = np.fromiter(map(len, M.roads), dtype=np.int64, count=count)
+            self.offsets = np.zeros(count + 1, dtype=np.int64)
+            np.cumsum(degrees, out=self.offsets[1:])
+            self.targets = np.fromiter(chain.from_iterable(M.roads), dtype=np.int64, count=int(self.offsets[-1]))
+            points = np.array([M.intersections[node] for node in range(count)], dtype=np.float64).reshape(count, 2)
+            self.x, self.y = points[:, 0].copy(), points[:, 1].copy()
+            sources = np.repeat(np.arange(count), degrees)
+            self.lengths = np.hypot(self.x[self.targets] - self.x[sources], self.y[self.targets] - self.y[sources])
+            self._x, self._y = self.x.tolist(), self.y.tolist()
+            self._offsets, self._targets = self.offsets.tolist(), self.targets.tolist()
+            self._lengths = self.lengths.tolist()
+        else:
+            self.x = self._x = [M.intersections[node][0] for node in range(count)]
+            self.y = self._y = [M.intersections[node][1] for node in range(count)]
+            self.offsets = self._offsets = [0]
+            for roads in M.roads:
+                self.offsets.append(self.offsets[-1] + len(roads))
+            self.targets = self._targets = list(chain.from_iterable(M.roads))
+            self.lengths = self._lengths = [
+                math.hypot(self.x[target] - self.x[source], self.y[target] - self.y[source])
+                for source, roads in enumerate(M.roads) for target in roads
+            ]
+
+    def __len__(self) -> int:
+        """
+        Return the number of intersections.
+
+        Returns:
+            int: The number of intersections.
+        """
+        return len(self._x)
+
+    def shortest_path(self, start: int, goal: int) -> Optional[list[int]]:
+        """
+        Find the shortest path between two intersections using the A* algorithm.
+
+        The frontier is a heap of (estimated total, distance so far, node)
+        entries. A node that is reached more cheaply is pushed again instead
+        of being updated in place, and the older entry is skipped when it is
+        popped (lazy deletion). The straight-line distance to the goal never
+        overestimates a road distance, so the first time the goal is popped
+        its path is the shortest.
+
+        Args:
+            start (int): The starting intersection.
+            goal (int): The goal intersection.
+
+        Returns:
+            Optional[list[int]]: The shortest path from start to goal, or None if no path is found.
+        """
+        if not (0 <= start < len(self) and 0 <= goal < len(self)):
+            return None
+        xs, ys = self._x, self._y
+        offsets, targets, lengths = self._offsets, self._targets, self._lengths
+        goal_x, goal_y = xs[goal], ys[goal]
+        hypot, heappush, heappop = math.hypot, heapq.heappush, heapq.heappop
+
+        # Indexed by node like the CSR arrays; unreached nodes stay at inf and -1
+        best = [math.inf] * len(self)
+        came_from = [-1] * len(self)
+        best[start] = 0.0
+        frontier = [(hypot(xs[start] - goal_x, ys[start] - goal_y), 0.0, start)]
+        while frontier:
+            _, distance, node = heappop(frontier)
+            if node == goal:
+                return reconstruct_path(came_from, goal)
+            if distance > best[node]:
+                # A stale entry: the node was pushed again with a shorter distance
+                continue
+            for edge in range(offsets[node], offsets[node + 1]):
+                neighbor = targets[edge]
+                candidate = distance + lengths[edge]
+                if candidate < best[neighbor]:
+                    best[neighbor] = candidate
+                    came_from[neighbor] = node
+                    estimate = candidate + hypot(xs[neighbor] - goal_x, ys[neighbor] - goal_y)
+                    heappush(frontier, (estimate, candidate, neighbor))
+        return None
+
+# Compiled forms of the maps searched so far, dropped along with their map
+_COMPILED_MAPS: "weakref.WeakKeyDictionary[Map, CompiledMap]" = weakref.WeakKeyDictionary()
+
+def compile_map(M: Map) -> CompiledMap:
+    """
+    Return the compiled form of a map, building it on first use.
+
+    Maps are not expected to change after they are loaded; a changed map
+    needs a new CompiledMap.
+
+    Args:
+        M (Map): The map to compile.
+
+    Returns:
+        CompiledMap: The arrays the A* search runs on.
+    """
+    compiled = _COMPILED_MAPS.get(M)
+    if compiled is None:
+        compiled = _COMPILED_MAPS[M] = CompiledMap(M)
+    return compiled
 
 def shortest_path(M: Map, start: int, goal: int) -> Optional[list[int]]:
     """
@@ -41,4 +182,76 @@ def shortest_path(M: Map, start: int, goal: int) -> Optional[list[int]]:
     Returns:
         Optional[list[int]]: The shortest path from the start node to the goal node, or None if no path is found.
     """
-    pass
+    return compile_map(M).shortest_path(start, goal)
+
+if __name__ == '__main__':
+    import random
+    import time
+
+    import networkx as nx
+
+    from helpers import load_map
+    from project_test import test
+
+    test(shortest_path)
+
+    map_10 = load_map('map-10.pickle')
+    # Edge case: The two intersections on the left are not connected to the rest of the map
+    print(shortest_path(map_10, 8, 0), shortest_path(map_10, 0, 42))
+    # Expected output: None None
+
+    def dict_shortest_path(M: Map, start: int, goal: int) -> Optional[list[int]]:
+        # A* on the Map's dictionary and road lists, calling heuristic for every road
+        best = [math.inf] * len(M.roads)
+        came_from = [-1] * len(M.roads)
+        best[start] = 0.0
+        frontier = [(heuristic(M.intersections[start], M.intersections[goal]), 0.0, start)]
+        while frontier:
+            _, distance, node = heapq.heappop(frontier)
+            if node == goal:
+                return reconstruct_path(came_from, goal)
+            if distance > best[node]:
+                continue
+            for neighbor in M.roads[node]:
+                candidate = distance + heuristic(M.intersections[node], M.intersections[neighbor])
+                if candidate < best[neighbor]:
+                    best[neighbor] = candidate
+                    came_from[neighbor] = node
+                    estimate = candidate + heuristic(M.intersections[neighbor], M.intersections[goal])
+                    heapq.heappush(frontier, (estimate, candidate, neighbor))
+        return None
+
+    def path_length(M: Map, path: list[int]) -> float:
+        return sum(heuristic(M.intersections[a], M.intersections[b]) for a, b in zip(path, path[1:]))
+
+    def road_grid(side: int) -> Map:
+        # A jittered grid of intersections with about 10% of the roads missing
+        G = nx.Graph()
+        for node in range(side * side):
+            G.add_node(node, pos=(node % side + random.uniform(-0.3, 0.3), node // side + random.uniform(-0.3, 0.3)))
+        for node in range(side * side):
+            if node % side + 1 < side and random.random() < 0.9:
+                G.add_edge(node, node + 1)
+            if node + side < side * side and random.random() < 0.9:
+                G.add_edge(node, node + side)
+        return Map(G)
+
+    # Benchmark: queries/sec on map-40 and on synthetic road grids
+    random.seed(40)
+    map_40 = load_map('map-40.pickle')
+    for name, M, query_count in (("map-40", map_40, 5000), ("grid 100x100", road_grid(100), 200),
+                                 ("grid 300x300", road_grid(300), 50)):
+        start_time = time.perf_counter()
+        compile_map(M)
+        compile_time = time.perf_counter() - start_time
+        queries = [(random.randrange(len(M.roads)), random.randrange(len(M.roads))) for _ in range(query_count)]
+        results = {}
+        for label, function in (("dict A*", dict_shortest_path), ("compiled A*", shortest_path)):
+            start_time = time.perf_counter()
+            results[label] = [function(M, start, goal) for start, goal in queries]
+            elapsed = time.perf_counter() - start_time
+            print(f"{name}: {label} {query_count / elapsed:.0f} queries/s")
+        # Equally short paths may differ, so compare their lengths
+        same = all(a == b or (a is not None and b is not None and math.isclose(path_length(M, a), path_length(M, b)))
+                   for a, b in zip(*results.values()))
+        print(f"{name}: compiled in {compile_time * 1000:.1f}ms, {'Pass' if same else 'Fail'}")
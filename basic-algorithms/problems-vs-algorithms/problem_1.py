@@ -12,17 +12,86 @@ test cases to verify that your algorithm is working properly.
 The expected time complexity is O(log(n)).
 """
 
+from typing import Iterable, Union
+
+try:
+    import numpy as np
+except ImportError:  # sqrt_many falls back to calling sqrt per value
+    np = None
+
 def sqrt(number: int) -> int:
     """
     Calculate the floored square root of a number
 
+    Uses integer Newton iteration, starting from a power of two above the
+    root, so the result is exact for arbitrarily large integers.
+
     Args:
     number(int): Number to find the floored square root
 
     Returns:
     int: Floored square root
+
+    Raises:
+    ValueError: If number is negative
+    """
+    if number < 0:
+        raise ValueError("sqrt() is not defined for negative numbers")
+    if number < 2:
+        return number
+    root = 1 << ((number.bit_length() + 1) // 2)
+    while True:
+        next_root = (root + number // root) // 2
+        if next_root >= root:
+            return root
+        root = next_root
+
+def sqrt_many(numbers: Union['np.ndarray', Iterable[int]]) -> Union['np.ndarray', list[int]]:
+    """
+    Calculate the floored square roots of many numbers at once
+
+    With NumPy, an integer array is rooted with a float square root and then
+    corrected with vectorized integer steps, so every result is exactly
+    floored even where the float root is off by one. Signed arrays are
+    worked on as int64 and unsigned ones as uint64, so values of 2**63 and
+    above are not wrapped to negatives. Without NumPy, or for other inputs,
+    sqrt is applied to each value.
+
+    Args:
+    numbers(np.ndarray | Iterable[int]): Non-negative numbers
+
+    Returns:
+    np.ndarray | list[int]: Floored square roots, as an int64 array for an
+    array input
+
+    Raises:
+    TypeError: If an array input does not have an integer dtype
+    ValueError: If any number is negative
     """
-    pass
+    if np is None or not isinstance(numbers, np.ndarray):
+        return [sqrt(number) for number in numbers]
+    if numbers.dtype.kind == 'u':
+        numbers = numbers.astype(np.uint64, copy=False)
+    elif numbers.dtype.kind == 'i':
+        numbers = numbers.astype(np.int64, copy=False)
+        if numbers.size and numbers.min() < 0:
+            raise ValueError("sqrt() is not defined for negative numbers")
+    else:
+        raise TypeError(f"sqrt_many() needs an integer array, not {numbers.dtype}")
+    roots = np.sqrt(numbers.astype(np.float64)).astype(numbers.dtype)
+    # Compare through division so that squaring never overflows int64
+    while True:
+        too_big = (roots > 0) & (roots > numbers // np.maximum(roots, 1))
+        if not too_big.any():
+            break
+        roots -= too_big
+    while True:
+        too_small = roots + 1 <= numbers // (roots + 1)
+        if not too_small.any():
+            break
+        roots += too_small
+    # Roots of 64-bit values are below 2 ** 32, so they always fit in int64
+    return roots.astype(np.int64, copy=False)
 
 if __name__ == "__main__":
     # Test cases
@@ -31,3 +100,40 @@ if __name__ == "__main__":
     print("Pass" if 4 == sqrt(16) else "Fail")  # Expected Output: Pass
     print("Pass" if 1 == sqrt(1) else "Fail")   # Expected Output: Pass
     print("Pass" if 5 == sqrt(27) else "Fail")  # Expected Output: Pass
+    print("Pass" if 10 ** 100 == sqrt(10 ** 200 + 10 ** 50) else "Fail")  # Expected Output: Pass
+    print("Pass" if 3037000499 == sqrt(2 ** 63 - 1) else "Fail")  # Expected Output: Pass
+    print("Pass" if [0, 1, 1, 3, 5] == list(sqrt_many([0, 1, 3, 9, 27])) else "Fail")  # Expected Output: Pass
+
+    # Benchmark against math.isqrt for scalar, big-int and batched inputs
+    import math
+    import random
+    import time
+
+    def benchmark(name: str, ours, reference, values) -> None:
+        start = time.perf_counter()
+        result = ours(values)
+        our_time = time.perf_counter() - start
+        start = time.perf_counter()
+        expected = reference(values)
+        reference_time = time.perf_counter() - start
+        matches = list(result) == list(expected)
+        print(f"{name}: {'Pass' if matches else 'Fail'}, {our_time:.4f}s vs math.isqrt {reference_time:.4f}s")
+
+    scalars = [random.randrange(2 ** 62) for _ in range(10 ** 5)]
+    benchmark("scalar", lambda values: [sqrt(value) for value in values],
+              lambda values: [math.isqrt(value) for value in values], scalars)
+    big_ints = [random.randrange(10 ** 600) for _ in range(10 ** 3)]
+    benchmark("big-int", lambda values: [sqrt(value) for value in values],
+              lambda values: [math.isqrt(value) for value in values], big_ints)
+    if np is not None:
+        batch = np.random.randint(0, 2 ** 63 - 1, size=10 ** 6, dtype=np.int64)
+        batch[:4] = [0, 1, 2 ** 63 - 1, 4503599761588224]
+        benchmark("batched", sqrt_many, lambda values: [math.isqrt(int(value)) for value in values], batch)
+        unsigned = np.array([0, 2 ** 63, 2 ** 64 - 1, 10 ** 19], dtype=np.uint64)
+        print("Pass" if [math.isqrt(int(value)) for value in unsigned] == list(sqrt_many(unsigned))
+              else "Fail")  # Expected Output: Pass
+        try:
+            sqrt_many(np.array([2.5, 9.0]))
+            print("Fail")
+        except TypeError:
+            print("Pass")  # Expected Output: Pass
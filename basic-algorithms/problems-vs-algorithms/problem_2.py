@@ -14,10 +14,183 @@ algorithm is correct. If necessary, add additional test cases to verify that
 your algorithm works correctly.
 """
 
+from bisect import bisect_left, bisect_right
+from typing import Iterable, Union
+
+try:
+    import numpy as np
+except ImportError:  # search_many falls back to one search per query
+    np = None
+
+class RotatedIndex:
+    """
+    A rotated sorted array prepared for repeated searches.
+
+    The rotation pivot is found once, after which the array is two sorted
+    runs, input_list[:pivot] and input_list[pivot:], and every query is a
+    plain binary search over one of them.
+
+    Duplicates are allowed. Finding the pivot is then O(log n) unless the
+    duplicates hide which half holds it, and O(n) in the worst case (for
+    example, all equal values but one), which no comparison-based search
+    can avoid. Every query after that stays O(log n).
+
+    Attributes:
+    input_list (list[int]): The rotated sorted array
+    pivot (int): The index of the smallest element
+    """
+    def __init__(self, input_list: list[int]) -> None:
+        """
+        Find the rotation pivot of a rotated sorted array, in O(log n)
+        without duplicates and O(n) in the worst case with them.
+
+        Args:
+        input_list (list[int]): The rotated sorted array
+        """
+        self.input_list = input_list
+        self.pivot = self._find_pivot()
+        self._array = None
+
+    def _find_pivot(self) -> int:
+        input_list = self.input_list
+        low, high = 0, len(input_list) - 1
+        while low < high:
+            middle = (low + high) // 2
+            if input_list[middle] > input_list[high]:
+                low = middle + 1
+            elif input_list[middle] < input_list[high]:
+                high = middle
+            else:
+                # Equal ends hide the pivot; step past high unless it is the pivot
+                if input_list[high - 1] > input_list[high]:
+                    return high
+                high -= 1
+        return low
+
+    def search(self, number: int) -> int:
+        """
+        Find the index of a number in O(log n).
+
+        Args:
+        number (int): Target number to find
+
+        Returns:
+        int: Lowest index of the target number or -1 if not found
+        """
+        input_list = self.input_list
+        if not input_list:
+            return -1
+        if self.pivot > 0 and number >= input_list[0]:
+            low, high = 0, self.pivot
+        else:
+            low, high = self.pivot, len(input_list)
+        index = bisect_left(input_list, number, low, high)
+        if index < high and input_list[index] == number:
+            return index
+        return -1
+
+    def lower_bound(self, number: int) -> int:
+        """
+        Count the elements smaller than a number in O(log n).
+
+        This is the position the number would take in the sorted (unrotated)
+        array, like bisect_left. Use index_of_rank to map it back to an
+        index of the rotated array.
+
+        Args:
+        number (int): The number to rank
+
+        Returns:
+        int: The number of elements smaller than number
+        """
+        input_list, pivot = self.input_list, self.pivot
+        return (bisect_left(input_list, number, pivot, len(input_list)) - pivot
+                + bisect_left(input_list, number, 0, pivot))
+
+    def upper_bound(self, number: int) -> int:
+        """
+        Count the elements smaller than or equal to a number in O(log n).
+
+        Args:
+        number (int): The number to rank
+
+        Returns:
+        int: The number of elements smaller than or equal to number
+        """
+        input_list, pivot = self.input_list, self.pivot
+        return (bisect_right(input_list, number, pivot, len(input_list)) - pivot
+                + bisect_right(input_list, number, 0, pivot))
+
+    def index_of_rank(self, rank: int) -> int:
+        """
+        Map a position in the sorted array to an index of the rotated array.
+
+        Args:
+        rank (int): A position in the sorted array, from 0 to n - 1
+
+        Returns:
+        int: The index of the rotated array holding that element
+        """
+        return (rank + self.pivot) % len(self.input_list)
+
+    def search_range(self, number: int) -> tuple[int, int]:
+        """
+        Find every occurrence of a number in O(log n).
+
+        The matches are consecutive in the sorted array, so they are
+        consecutive in the rotated array too, except that they may wrap
+        around its end: when first > last the matches are the indices
+        first..n-1 followed by 0..last.
+
+        Args:
+        number (int): Target number to find
+
+        Returns:
+        tuple[int, int]: The indices of the first and last occurrence, in
+        rotated order, or (-1, -1) if not found
+        """
+        first_rank, end_rank = self.lower_bound(number), self.upper_bound(number)
+        if first_rank == end_rank:
+            return -1, -1
+        return self.index_of_rank(first_rank), self.index_of_rank(end_rank - 1)
+
+    def search_many(self, numbers: Union['np.ndarray', Iterable[int]]) -> Union['np.ndarray', list[int]]:
+        """
+        Find the indices of many numbers at once.
+
+        With NumPy, all queries are answered by two vectorized
+        np.searchsorted calls, one per sorted run.
+
+        Args:
+        numbers (np.ndarray | Iterable[int]): Target numbers to find
+
+        Returns:
+        np.ndarray | list[int]: Index of each target number, or -1 where it
+        is not found
+        """
+        if np is None:
+            return [self.search(number) for number in numbers]
+        queries = np.asarray(numbers)
+        if not self.input_list:
+            return np.full(queries.shape, -1, dtype=np.int64)
+        if self._array is None:
+            self._array = np.asarray(self.input_list)
+        array, pivot = self._array, self.pivot
+        in_first_run = (queries >= array[0]) if pivot > 0 else np.zeros(queries.shape, dtype=bool)
+        indices = np.where(in_first_run,
+                           np.searchsorted(array[:pivot], queries),
+                           pivot + np.searchsorted(array[pivot:], queries))
+        clipped = np.minimum(indices, len(array) - 1)
+        found = (indices < np.where(in_first_run, pivot, len(array))) & (array[clipped] == queries)
+        return np.where(found, indices, -1)
+
 def rotated_array_search(input_list: list[int], number: int) -> int:
     """
     Find the index by searching in a rotated sorted array
 
+    For many searches over the same array, build a RotatedIndex once
+    instead, so the pivot is not searched for again on every call.
+
     Args:
     input_list (list[int]): Input array to search
     number (int): Target number to find
@@ -25,7 +198,7 @@ def rotated_array_search(input_list: list[int], number: int) -> int:
     Returns:
     int: Index of the target number or -1 if not found
     """
-    pass
+    return RotatedIndex(input_list).search(number)
 
 # Test function using provided test cases
 def test_function(test_case: list[list[int], int]) -> None:
@@ -80,3 +253,81 @@ if __name__ == '__main__':
     # Normal case: Number in the middle of the list
     test_function([[4, 5, 6, 7, 0, 1, 2], 6])
     # Expected output: Pass
+
+    # Edge case: Number not in the list
+    test_function([[4, 5, 6, 7, 0, 1, 2], 3])
+    # Expected output: Pass
+
+    # Normal case: List that is not rotated
+    test_function([[0, 1, 2, 4, 5, 6, 7], 5])
+    # Expected output: Pass
+
+    # Normal case: Every element of a rotated list, searched in one batch
+    rotated_list = [6, 7, 8, 9, 10, 1, 2, 3, 4]
+    batch = [6, 10, 1, 4, 5, 0, 11]
+    results = RotatedIndex(rotated_list).search_many(batch)
+    print("Pass" if list(results) == [linear_search(rotated_list, number) for number in batch] else "Fail")
+    # Expected output: Pass
+
+    # Benchmark: thousands of lookups against the same rotated array
+    import random
+    import time
+    size = 10 ** 6
+    rotated_list = list(range(size // 3, size)) + list(range(size // 3))
+    queries = [random.randrange(-10, size + 10) for _ in range(10 ** 4)]
+    start = time.perf_counter()
+    per_call = [rotated_array_search(rotated_list, number) for number in queries]
+    per_call_time = time.perf_counter() - start
+    start = time.perf_counter()
+    index = RotatedIndex(rotated_list)
+    cached = [index.search(number) for number in queries]
+    cached_time = time.perf_counter() - start
+    index.search_many(queries[:1])  # converts the array once, outside the timing
+    start = time.perf_counter()
+    batched = index.search_many(queries)
+    batched_time = time.perf_counter() - start
+    start = time.perf_counter()
+    linear = [linear_search(rotated_list, number) for number in queries[:20]]
+    linear_time = (time.perf_counter() - start) / 20 * len(queries)
+    print("Pass" if per_call == cached == list(batched) and linear == cached[:20] else "Fail")
+    print(f"{len(queries)} lookups: per-call {per_call_time:.4f}s, RotatedIndex {cached_time:.4f}s, "
+          f"search_many {batched_time:.4f}s, linear_search ~{linear_time:.1f}s (extrapolated)")
+
+    # Normal case: Duplicates, including a run that wraps around the end
+    rotated_list = [2, 2, 3, 3, 4, 1, 1, 2]
+    index = RotatedIndex(rotated_list)
+    print("Pass" if all(index.search(number) == linear_search(rotated_list, number)
+                        for number in range(6)) else "Fail")
+    # Expected output: Pass
+    print("Pass" if (index.search_range(2), index.search_range(3), index.search_range(5))
+          == ((7, 1), (2, 3), (-1, -1)) else "Fail")
+    # Expected output: Pass
+    print("Pass" if (index.lower_bound(2), index.upper_bound(2), index.index_of_rank(0))
+          == (2, 5, 5) else "Fail")
+    # Expected output: Pass
+
+    # Edge case: Every rotation of sorted lists with heavy duplication
+    for _ in range(200):
+        sorted_list = sorted(random.choice([0, 1, 1, 2]) for _ in range(random.randrange(1, 12)))
+        for rotation in range(len(sorted_list)):
+            rotated_list = sorted_list[rotation:] + sorted_list[:rotation]
+            index = RotatedIndex(rotated_list)
+            if rotated_list[index.pivot:] + rotated_list[:index.pivot] != sorted_list:
+                print("Fail")
+    print("Pass")
+    # Expected output: Pass
+
+    # Benchmark: adversarial duplication, where the pivot search degrades to
+    # O(n) but queries after it stay O(log n)
+    for size in (10 ** 4, 10 ** 5, 10 ** 6):
+        rotated_list = [1] * size
+        rotated_list[size // 3] = 0
+        start = time.perf_counter()
+        index = RotatedIndex(rotated_list)
+        pivot_time = time.perf_counter() - start
+        start = time.perf_counter()
+        for _ in range(1000):
+            index.search_range(1)
+        range_time = (time.perf_counter() - start) / 1000
+        print(f"{size} mostly-equal elements: pivot {pivot_time * 1e3:.2f}ms, "
+              f"search_range {range_time * 1e6:.2f}us, {index.search_range(1)}")
@@ -13,22 +13,80 @@ algorithm is correct. If necessary, add additional test cases to verify that
 your algorithm works correctly.
 """
 
-def rearrange_digits(input_list: list[int]) -> tuple[int, int]:
+from typing import Union
+
+def _split_counts(counts: list[int]) -> tuple[list[int], list[int]]:
+    """
+    Deal the digits, from 9 down to 0, alternately to two numbers.
+
+    Args:
+    counts (list[int]): How many times each digit 0-9 appears.
+
+    Returns:
+    tuple[list[int], list[int]]: How many times each digit appears in the
+    first and in the second number.
+    """
+    first, second = [0] * 10, [0] * 10
+    first_turn = True
+    for digit in range(9, -1, -1):
+        count = counts[digit]
+        first[digit] = (count + first_turn) // 2
+        second[digit] = count - first[digit]
+        if count % 2:
+            first_turn = not first_turn
+    return first, second
+
+def _counts_to_int(counts: list[int]) -> int:
+    """
+    Build the number whose digits, in descending order, have the given counts.
+
+    A run of k equal digits d is d * (10**k - 1) / 9, so the number takes at
+    most ten big-integer steps instead of one step per digit.
+    """
+    value = 0
+    for digit in range(9, -1, -1):
+        count = counts[digit]
+        if count:
+            power = 10 ** count
+            value = value * power + digit * (power - 1) // 9
+    return value
+
+def _counts_to_str(counts: list[int]) -> str:
+    """
+    Build the digit string, in descending order, with the given counts.
+    """
+    return "".join(str(digit) * counts[digit] for digit in range(9, -1, -1)) or "0"
+
+def rearrange_digits(input_list: list[int], as_string: bool = False) -> Union[tuple[int, int], tuple[str, str]]:
     """
     Rearrange the digits of the input list to form two numbers such that their 
-    sum is maximized.
+    sum is maximum.
 
-    This function sorts the input list in descending order and then alternates 
-    the digits to form two numbers.
+    Since every element is a digit from 0 to 9, the digits are counted
+    instead of sorted, which is O(n). Dealing them in descending order
+    alternately to the two numbers maximizes the sum.
 
     Args:
-    input_list (list[int]): A list of integers to be rearranged.
+    input_list (list[int]): A list of digits (0-9) to be rearranged.
+    as_string (bool): Return the two numbers as digit strings instead of
+    integers, which avoids building huge integers for very long inputs.
 
     Returns:
-    tuple[int, int]: A tuple containing two integers formed by rearranging the 
-    digits of the input list.
+    tuple[int, int] | tuple[str, str]: A tuple containing two numbers formed
+    by rearranging the digits of the input list.
+
+    Raises:
+    ValueError: If an element is not a digit from 0 to 9, including
+    negative numbers, which cannot be placed as a digit.
     """
-    pass
+    # list.count runs in C, so ten passes beat one Python-level loop
+    counts = [input_list.count(digit) for digit in range(10)]
+    if sum(counts) != len(input_list):
+        raise ValueError("rearrange_digits() expects digits from 0 to 9")
+    first, second = _split_counts(counts)
+    if as_string:
+        return _counts_to_str(first), _counts_to_str(second)
+    return _counts_to_int(first), _counts_to_int(second)
 
 def test_function(test_case: tuple[list[int], list[int]]) -> None:
     """
@@ -55,8 +113,12 @@ if __name__ == '__main__':
     test_function(([9], [9, 0]))
     # Expected output: Pass
 
-    # Normal case: Mixed positive and negative numbers
-    test_function(([3, -2, 1, -4, 5], [531, -42]))
+    # Edge case: Negative numbers are not digits and are rejected
+    try:
+        rearrange_digits([3, -2, 1, -4, 5])
+        print("Fail")
+    except ValueError:
+        print("Pass")
     # Expected output: Pass
 
     # Normal case: list with zeros
@@ -64,5 +126,30 @@ if __name__ == '__main__':
     # Expected output: Pass
 
     # Normal case: list with repeated numbers
-    test_function(([2, 2, 2, 2, 2], [222, 2]))
+    test_function(([2, 2, 2, 2, 2], [222, 22]))
     # Expected output: Pass
+
+    # Normal case: Mixed digits
+    test_function(([1, 2, 3, 4, 5], [542, 31]))
+    # Expected output: Pass
+
+    # Normal case: Digits returned as strings
+    print("Pass" if rearrange_digits([4, 6, 2, 5, 9, 8], as_string=True) == ("964", "852") else "Fail")
+    # Expected output: Pass
+
+    # Benchmark: from 10**3 to 10**7 digits
+    import random
+    import time
+    for exponent in range(3, 8):
+        digits = [random.randrange(10) for _ in range(10 ** exponent)]
+        start = time.perf_counter()
+        first, second = rearrange_digits(digits, as_string=True)
+        string_time = time.perf_counter() - start
+        valid = len(first) - len(second) in (0, 1) and first == "".join(sorted(first, reverse=True))
+        timings = f"strings {string_time:.4f}s"
+        # Integers this long are dominated by big-number multiplication
+        if exponent <= 6:
+            start = time.perf_counter()
+            rearrange_digits(digits)
+            timings += f", integers {time.perf_counter() - start:.4f}s"
+        print(f"10**{exponent} digits: {'Pass' if valid else 'Fail'}, {timings}")
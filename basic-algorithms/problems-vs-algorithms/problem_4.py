@@ -14,19 +14,135 @@ correct. If necessary, add additional test cases to verify that your algorithm
 works correctly.
 """
 
-def sort_012(input_list: list[int]) -> list[int]:
+from array import array
+from typing import Sequence, Union
+
+try:
+    import numpy as np
+except ImportError:  # NumPy arrays are then handled through memoryview
+    np = None
+
+# Number of elements counted or filled per step when partitioning a buffer,
+# which bounds the temporary memory regardless of the buffer size
+CHUNK_SIZE = 1 << 20
+
+Buffer = Union[bytearray, memoryview, array, 'np.ndarray']
+
+def _partition_numpy(values: 'np.ndarray', alphabet: Sequence[int]) -> None:
+    # reshape would copy a non-contiguous array (such as a transposed view),
+    # so those are read and written through their flat iterator instead
+    flat = values.reshape(-1) if values.flags.c_contiguous else values.flat
+    counts = [0] * len(alphabet)
+    for start in range(0, values.size, CHUNK_SIZE):
+        chunk = flat[start:start + CHUNK_SIZE]
+        for position, symbol in enumerate(alphabet):
+            counts[position] += int(np.count_nonzero(chunk == symbol))
+    if sum(counts) != values.size:
+        raise ValueError("sort_012() found a value outside the alphabet")
+    start = 0
+    for symbol, count in zip(alphabet, counts):
+        flat[start:start + count] = symbol
+        start += count
+
+def _partition_memoryview(view: memoryview, alphabet: Sequence[int]) -> None:
+    if view.itemsize == 1 and view.format in ('B', 'b', 'c'):
+        view = view.cast('B')
+        # Count bytes in C; signed values map to their two's complement byte
+        symbols = [bytes([symbol % 256]) for symbol in alphabet]
+        def count(chunk: memoryview) -> list[int]:
+            data = chunk.tobytes()
+            return [data.count(symbol) for symbol in symbols]
+        def fill_chunk(symbol_index: int) -> memoryview:
+            return memoryview(symbols[symbol_index] * CHUNK_SIZE)
+    else:
+        def count(chunk: memoryview) -> list[int]:
+            values = chunk.tolist()
+            return [values.count(symbol) for symbol in alphabet]
+        def fill_chunk(symbol_index: int) -> memoryview:
+            return memoryview(array(view.format, [alphabet[symbol_index]]) * CHUNK_SIZE)
+
+    # Each chunk is converted once and all symbols are counted from that copy
+    counts = [0] * len(alphabet)
+    for start in range(0, len(view), CHUNK_SIZE):
+        for symbol_index, symbol_count in enumerate(count(view[start:start + CHUNK_SIZE])):
+            counts[symbol_index] += symbol_count
+    if sum(counts) != len(view):
+        raise ValueError("sort_012() found a value outside the alphabet")
+
+    start = 0
+    for symbol_index, symbol_count in enumerate(counts):
+        if not symbol_count:
+            continue
+        fill = fill_chunk(symbol_index)
+        end = start + symbol_count
+        while start < end:
+            step = min(CHUNK_SIZE, end - start)
+            view[start:start + step] = fill[:step]
+            start += step
+
+def partition_in_place(buffer: Buffer, alphabet: Sequence[int]) -> Buffer:
+    """
+    Sort a writable buffer whose values come from a small alphabet, in place.
+
+    The values are counted and then written back as consecutive runs in
+    alphabet order, both in fixed-size chunks, so no copy of the buffer is
+    made. NumPy arrays are counted with np.count_nonzero and filled with
+    slice assignment; other buffers go through memoryview, counting bytes in
+    C for one-byte formats.
+
+    Args:
+    buffer (Buffer): A writable buffer such as a bytearray, an array.array, a
+    contiguous memoryview or a NumPy array. NumPy arrays may have any shape
+    or strides and are sorted in C (row-major) order.
+    alphabet (Sequence[int]): The possible values, in the order to sort them.
+
+    Returns:
+    Buffer: The same buffer, sorted.
+
+    Raises:
+    TypeError: If the buffer is read-only.
+    ValueError: If the buffer holds a value that is not in the alphabet.
+    """
+    if np is not None and isinstance(buffer, np.ndarray):
+        if not buffer.flags.writeable:
+            raise TypeError("sort_012() needs a writable buffer")
+        _partition_numpy(buffer, alphabet)
+        return buffer
+    view = memoryview(buffer)
+    if view.readonly:
+        raise TypeError("sort_012() needs a writable buffer")
+    _partition_memoryview(view, alphabet)
+    return buffer
+
+def sort_012(input_list: Union[list[int], Buffer]) -> Union[list[int], Buffer]:
     """
     Sort an array consisting only of 0s, 1s, and 2s in a single traversal.
 
     This function uses the Dutch National Flag algorithm to sort the array in-place.
+    Buffers such as bytearrays, array.arrays and NumPy arrays are instead
+    sorted in place by partition_in_place, without converting them to lists.
 
     Args:
-    input_list (list[int]): A list of integers where each integer is either 0, 1, or 2.
+    input_list (list[int] | Buffer): A list of integers where each integer is either 0, 1, or 2.
 
     Returns:
-    list[int]: The sorted list with all 0s, followed by all 1s, and then all 2s.
+    list[int] | Buffer: The sorted list with all 0s, followed by all 1s, and then all 2s.
     """
-    pass
+    if not isinstance(input_list, list):
+        return partition_in_place(input_list, (0, 1, 2))
+    low, middle, high = 0, 0, len(input_list) - 1
+    while middle <= high:
+        value = input_list[middle]
+        if value == 0:
+            input_list[low], input_list[middle] = value, input_list[low]
+            low += 1
+            middle += 1
+        elif value == 1:
+            middle += 1
+        else:
+            input_list[middle], input_list[high] = input_list[high], value
+            high -= 1
+    return input_list
 
 def test_function(test_case: list[list[int]]) -> None:
     """
@@ -41,9 +157,10 @@ def test_function(test_case: list[list[int]]) -> None:
     None: Prints the sorted array and "Pass" if the output from sort_012 
     matches the sorted input array, otherwise prints "Fail".
     """
+    expected: list[int] = sorted(test_case[0])
     sorted_array: list[int] = sort_012(test_case[0])
     print(sorted_array)
-    if sorted_array == sorted(test_case[0]):
+    if sorted_array == expected:
         print("Pass")
     else:
         print("Fail")
@@ -64,3 +181,51 @@ if __name__ == "__main__":
     # Normal case: Reverse sorted list
     test_function([[2, 2, 1, 1, 0, 0]])
     # Expected output: Pass
+
+    # Normal case: bytearray and array.array sorted in place
+    status = bytearray([2, 0, 1, 2, 1, 0, 0])
+    statuses = array('q', [2, 0, 1, 2, 1, 0, 0])
+    sort_012(status)
+    sort_012(statuses)
+    print("Pass" if list(status) == list(statuses) == [0, 0, 0, 1, 1, 2, 2] else "Fail")
+    # Expected output: Pass
+
+    # Normal case: k-way partition in a custom order
+    print("Pass" if list(partition_in_place(bytearray([3, 1, 0, 3, 1]), (3, 1, 0))) == [3, 3, 1, 1, 0]
+          else "Fail")
+    # Expected output: Pass
+
+    # Edge case: Read-only buffers and values outside the alphabet
+    for bad_input, error in ((bytes([1, 0]), TypeError), (bytearray([0, 3]), ValueError)):
+        try:
+            sort_012(bad_input)
+            print("Fail")
+        except error:
+            print("Pass")
+    # Expected output: Pass
+    # Expected output: Pass
+
+    # Edge case: Non-contiguous NumPy views are sorted in the caller's array
+    if np is not None:
+        grid = np.array([[2, 0, 1], [1, 2, 0]], dtype=np.int8)
+        sort_012(grid.T)
+        every_other = np.array([2, 9, 0, 9, 1, 9, 0], dtype=np.int64)
+        sort_012(every_other[::2])
+        print("Pass" if grid.T.ravel().tolist() == [0, 0, 1, 1, 2, 2]
+              and every_other.tolist() == [0, 9, 0, 9, 1, 9, 2] else "Fail")
+    # Expected output: Pass
+
+    # Benchmark: list Dutch National Flag against in-place buffer sorting
+    import random
+    import time
+    size = 10 ** 6
+    values = [random.randrange(3) for _ in range(size)]
+    inputs = [("list", list(values)), ("bytearray", bytearray(values)), ("array('b')", array('b', values))]
+    if np is not None:
+        inputs.append(("numpy uint8", np.array(values, dtype=np.uint8)))
+    for name, input_values in inputs:
+        start = time.perf_counter()
+        sort_012(input_values)
+        elapsed = time.perf_counter() - start
+        correct = list(input_values[:1]) == [0] and list(input_values[-1:]) == [2]
+        print(f"{name}: {'Pass' if correct else 'Fail'}, {size / elapsed / 1e6:.1f}M elements/s")
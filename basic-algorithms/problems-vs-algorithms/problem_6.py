@@ -11,20 +11,146 @@ correct. If necessary, add additional test cases to verify that your algorithm
 works correctly.
 """
 
-from typing import Optional
+from typing import Iterable, Optional, Union
 
-def get_min_max(ints: list[int]) -> Optional[tuple[int, int]]:
+try:
+    import numpy as np
+except ImportError:  # Arrays are then scanned like lists
+    np = None
+
+# Elements reduced per step on the NumPy path, small enough for the chunk to
+# stay in cache between the min and the max reduction
+NUMPY_CHUNK = 1 << 16
+
+def _pairwise_min_max(ints: Iterable[int]) -> Optional[tuple[int, int]]:
+    """
+    Scan values two at a time: the smaller of each pair is only compared
+    with the minimum and the larger only with the maximum, so n values take
+    about 1.5n comparisons instead of 2n.
+    """
+    values = iter(ints)
+    for first in values:
+        break
+    else:
+        return None
+    smallest = largest = first
+    for first in values:
+        second = next(values, first)
+        if first > second:
+            first, second = second, first
+        if first < smallest:
+            smallest = first
+        if second > largest:
+            largest = second
+    return smallest, largest
+
+def _numpy_min_max(values: 'np.ndarray') -> Optional[tuple[int, int]]:
+    if not values.size:
+        return None
+    # reshape would copy a non-contiguous array (such as a transposed view),
+    # so those are read in chunks through their flat iterator instead
+    flat = values.reshape(-1) if values.flags.c_contiguous else values.flat
+    smallest = largest = flat[0]
+    for start in range(0, values.size, NUMPY_CHUNK):
+        chunk = flat[start:start + NUMPY_CHUNK]
+        chunk_min, chunk_max = chunk.min(), chunk.max()
+        if chunk_min < smallest:
+            smallest = chunk_min
+        if chunk_max > largest:
+            largest = chunk_max
+    return smallest.item(), largest.item()
+
+class MinMaxAccumulator:
+    """
+    Track the minimum and maximum of values that arrive in chunks.
+
+    Accumulators can be fed from different files or worker processes and
+    merged afterwards.
+
+    Attributes:
+    smallest (Optional[int]): The minimum so far, or None before any value
+    largest (Optional[int]): The maximum so far, or None before any value
+    """
+    def __init__(self) -> None:
+        """
+        Create an accumulator that has not seen any value.
+        """
+        self.smallest: Optional[int] = None
+        self.largest: Optional[int] = None
+
+    def _include(self, result: Optional[tuple[int, int]]) -> None:
+        if result is None:
+            return
+        smallest, largest = result
+        if self.smallest is None or smallest < self.smallest:
+            self.smallest = smallest
+        if self.largest is None or largest > self.largest:
+            self.largest = largest
+
+    def update(self, chunk: Union[list[int], 'np.ndarray']) -> 'MinMaxAccumulator':
+        """
+        Include a chunk of values.
+
+        Args:
+        chunk (list[int] | np.ndarray): The values to include
+
+        Returns:
+        MinMaxAccumulator: This accumulator, to allow chaining
+        """
+        self._include(get_min_max(chunk))
+        return self
+
+    def merge(self, other: 'MinMaxAccumulator') -> 'MinMaxAccumulator':
+        """
+        Include every value seen by another accumulator.
+
+        Args:
+        other (MinMaxAccumulator): The accumulator to merge in
+
+        Returns:
+        MinMaxAccumulator: This accumulator, to allow chaining
+        """
+        self._include(other.result())
+        return self
+
+    def result(self) -> Optional[tuple[int, int]]:
+        """
+        Return the minimum and maximum of every value seen.
+
+        Returns:
+        Optional[tuple[int, int]]: A tuple containing the minimum and maximum
+        integer, or None if no value was seen
+        """
+        if self.smallest is None:
+            return None
+        return self.smallest, self.largest
+
+def get_min_max(ints: Union[list[int], 'np.ndarray']) -> Optional[tuple[int, int]]:
     """
     Return a tuple(min, max) out of list of unsorted integers.
+
+    Lists are scanned in pairs with about 1.5n comparisons. NumPy arrays are
+    reduced chunk by chunk in C.
     
     Args:
-    ints (list[int]): list of integers containing one or more integers
+    ints (list[int] | np.ndarray): list of integers containing one or more integers
 
     Returns:
     Optional[tuple[int, int]]: A tuple containing the minimum and maximum 
     integer, or None if the list is empty
     """
-    pass
+    if np is not None and isinstance(ints, np.ndarray):
+        return _numpy_min_max(ints)
+    return _pairwise_min_max(ints)
+
+def _accumulate_random_chunk(seed: int) -> MinMaxAccumulator:
+    """
+    Generate and reduce 10**7 random values in a worker process for the
+    benchmark below. It lives at module level so that worker processes
+    started with spawn or forkserver can import it.
+    """
+    generator = np.random.default_rng(seed)
+    return MinMaxAccumulator().update(generator.integers(-10 ** 9, 10 ** 9, size=10 ** 7))
 
 if __name__ == '__main__':
     # Edge case: Empty input list
@@ -42,3 +168,48 @@ if __name__ == '__main__':
     # Normal case: list with already sorted numbers
     print(get_min_max([1, 2, 3, 4, 5]))
     # Expected output: (1, 5)
+
+    # Edge case: single element and odd length lists
+    print(get_min_max([7]))
+    # Expected output: (7, 7)
+    print(get_min_max([3, -1, 4, 1, 5, 9, 2]))
+    # Expected output: (-1, 9)
+
+    # Normal case: chunks accumulated separately and merged
+    left = MinMaxAccumulator().update([5, 8, -3]).update([])
+    right = MinMaxAccumulator().update([12, 0])
+    print(left.merge(right).result())
+    # Expected output: (-3, 12)
+
+    # Edge case: Non-contiguous NumPy views
+    if np is not None:
+        grid = np.arange(12).reshape(3, 4) - 5
+        print(get_min_max(grid.T), get_min_max(grid[:, ::2]))
+    # Expected output: (-5, 6) (-5, 5)
+
+    # Benchmark: lists, NumPy arrays and chunked accumulation across processes
+    import random
+    import time
+    from concurrent.futures import ProcessPoolExecutor
+
+    values = [random.randrange(-10 ** 9, 10 ** 9) for _ in range(10 ** 6)]
+    start = time.perf_counter()
+    result = get_min_max(values)
+    print(f"list, 10**6: {result == (min(values), max(values))}, {time.perf_counter() - start:.3f}s")
+    if np is not None:
+        for exponent in (6, 7, 8):
+            array = np.random.default_rng(exponent).integers(-10 ** 9, 10 ** 9, size=10 ** exponent)
+            start = time.perf_counter()
+            result = get_min_max(array)
+            elapsed = time.perf_counter() - start
+            print(f"numpy, 10**{exponent}: {result == (array.min(), array.max())}, {elapsed:.3f}s")
+            del array
+        # Chunks of 10**7 generated and reduced in worker processes, then
+        # merged; raise the chunk count to 100 for 10**9 values
+        chunk_count = 10
+        start = time.perf_counter()
+        total = MinMaxAccumulator()
+        with ProcessPoolExecutor() as executor:
+            for accumulator in executor.map(_accumulate_random_chunk, range(chunk_count)):
+                total.merge(accumulator)
+        print(f"streamed, {chunk_count}*10**7: {total.result()}, {time.perf_counter() - start:.3f}s")
@@ -18,28 +18,67 @@ cases provided below to verify that your algorithm is correct. If necessary,
 add additional test cases to verify that your algorithm works correctly.
 """
 
+import sys
+import threading
+from collections import OrderedDict
 from typing import Optional
 
+def _is_dynamic(part: str) -> bool:
+    """
+    Check whether a route part is a ":param" or "*splat" segment.
+
+    Args:
+    part (str): A part of a route.
+
+    Returns:
+    bool: True if the part captures a value from the request path.
+    """
+    return part[0] in ":*"
+
 class RouteTrieNode:
     """
     A node in the RouteTrie, representing a part of a route.
 
+    The trie is compressed (a radix trie): a chain of nodes that have one
+    child and no handler is merged into a single edge, so the node stores
+    every path part on the edge that leads to it. Only static parts are
+    compressed; a ":param" segment is a separate child that matches any
+    single part, and a "*splat" segment ends the route and matches the rest
+    of the path.
+
     Attributes:
-    children (dict): A dictionary mapping part of the route to the corresponding RouteTrieNode.
+    parts (tuple[str, ...]): The path parts on the edge from the parent to this node.
+    children (dict): A dictionary mapping the first part of each outgoing edge to the corresponding RouteTrieNode.
+    param_child (Optional[RouteTrieNode]): The child matching any single part, if any.
+    wildcard_child (Optional[RouteTrieNode]): The child matching the rest of the path, if any.
     handler (Optional[str]): The handler associated with this node, if any.
+    param_names (tuple[str, ...]): The names of the values captured on the way to this node's handler.
     """
-    def __init__(self):
+    def __init__(self, parts: tuple[str, ...] = ()):
         """
         Initialize a RouteTrieNode with an empty dictionary for children and no handler.
+
+        Args:
+        parts (tuple[str, ...]): The path parts on the edge leading to this node.
         """
-        pass
+        self.parts: tuple[str, ...] = parts
+        self.children: dict[str, RouteTrieNode] = {}
+        self.param_child: Optional[RouteTrieNode] = None
+        self.wildcard_child: Optional[RouteTrieNode] = None
+        self.handler: Optional[str] = None
+        self.param_names: tuple[str, ...] = ()
 
 class RouteTrie:
     """
     A trie (prefix tree) for storing routes and their handlers.
 
+    The trie is the mutable builder for route tables: routes are inserted
+    here and `compile` flattens them into an immutable RouteTable, which is
+    what lookups walk.
+
     Attributes:
     root (RouteTrieNode): The root node of the trie.
+    static_routes (dict[str, str]): Maps every normalized route without parameters to its handler.
     """
     def __init__(self, root_handler: str):
         """
@@ -48,17 +87,115 @@ class RouteTrie:
         Args:
         root_handler (str): The handler for the root node.
         """
-        pass
+        self.root = RouteTrieNode()
+        self.root.handler = root_handler
+        self.static_routes: dict[str, str] = {"/": root_handler}
+        self._table: Optional[RouteTable] = None
 
     def insert(self, path_parts: list[str], handler: str) -> None:
         """
         Insert a route and its handler into the trie.
 
+        Runs of static parts are inserted as compressed edges, and each
+        ":param" or "*splat" part moves to the node's parameter or wildcard
+        child.
+
         Args:
         path_parts (list[str]): A list of parts of the route.
         handler (str): The handler for the route.
+
+        Raises:
+        ValueError: If a "*splat" part is not the last part of the route.
+        """
+        self._table = None
+        route = "/".join(path_parts)
+        if (":" not in route and "*" not in route) or not any(_is_dynamic(part) for part in path_parts):
+            # Fully static routes, the common case, skip the part-by-part scan
+            self.static_routes["/" + route] = handler
+            node = self._insert_static(self.root, path_parts)
+            node.handler = handler
+            node.param_names = ()
+            return
+        for part in path_parts[:-1]:
+            if part[0] == "*":
+                raise ValueError(f"'{part}' must be the last part of the route")
+
+        node = self.root
+        names = []
+        position = 0
+        while position < len(path_parts):
+            part = path_parts[position]
+            if part[0] == ":":
+                if node.param_child is None:
+                    node.param_child = RouteTrieNode()
+                node = node.param_child
+                names.append(part[1:])
+                position += 1
+            elif part[0] == "*":
+                if node.wildcard_child is None:
+                    node.wildcard_child = RouteTrieNode()
+                node = node.wildcard_child
+                names.append(part[1:])
+                position += 1
+            else:
+                end = position + 1
+                while end < len(path_parts) and not _is_dynamic(path_parts[end]):
+                    end += 1
+                node = self._insert_static(node, path_parts[position:end])
+                position = end
+        node.handler = handler
+        node.param_names = tuple(names)
+
+    def _insert_static(self, node: RouteTrieNode, path_parts: list[str]) -> RouteTrieNode:
+        """
+        Insert a run of static parts below a node.
+
+        An edge that only partly matches the new parts is split at the
+        first differing part.
+
+        Args:
+        node (RouteTrieNode): The node to insert below.
+        path_parts (list[str]): The static parts to insert.
+
+        Returns:
+        RouteTrieNode: The node reached at the end of the parts.
         """
-        pass
+        size = len(path_parts)
+        position = 0
+        while position < size:
+            child = node.children.get(path_parts[position])
+            if child is None:
+                node.children[path_parts[position]] = leaf = RouteTrieNode(tuple(path_parts[position:]))
+                return leaf
+            # The first part matched through the dictionary key
+            child_parts = child.parts
+            limit = min(len(child_parts), size - position)
+            common = 1
+            while common < limit and child_parts[common] == path_parts[position + common]:
+                common += 1
+            if common < len(child_parts):
+                # Split the edge: the shared parts lead to a new middle node
+                middle = RouteTrieNode(child.parts[:common])
+                child.parts = child.parts[common:]
+                middle.children[child.parts[0]] = child
+                node.children[path_parts[position]] = middle
+                child = middle
+            node = child
+            position += common
+        return node
+
+    def compile(self) -> "RouteTable":
+        """
+        Flatten the trie into an immutable RouteTable.
+
+        The table is cached until the next insert.
+
+        Returns:
+        RouteTable: A snapshot of every route inserted so far.
+        """
+        if self._table is None:
+            self._table = RouteTable(self)
+        return self._table
 
     def find(self, path_parts: list[str]) ->  Optional[str]:
         """
@@ -70,35 +207,324 @@ class RouteTrie:
         Returns:
         str or None: The handler for the route if found, otherwise None.
         """
-        pass
+        result = self.compile().resolve("/".join(path_parts))
+        return result[0] if result is not None else None
+
+    def match(self, path_parts: list[str]) -> Optional[tuple[str, dict[str, str]]]:
+        """
+        Find the handler for a given route and the values captured by its parameters.
+
+        Args:
+        path_parts (list[str]): A list of parts of the route.
+
+        Returns:
+        tuple[str, dict[str, str]] or None: The handler and the captured values, or None if no route matches.
+        """
+        path = "/".join(path_parts)
+        result = self.compile().resolve(path)
+        if result is None:
+            return None
+        handler, names, captured = result
+        return handler, _captured_params(path, names, captured)
+
+class RouteTable:
+    """
+    An immutable, flattened snapshot of a RouteTrie.
+
+    Nodes are numbered in breadth-first order, with the root as node 0, and
+    each attribute is a tuple indexed by node number. Nothing in a table
+    changes after it is built, so any number of threads can walk it without
+    locks while a new table is compiled on the side.
+
+    Attributes:
+    parts (tuple[tuple[str, ...], ...]): The path parts on the edge leading to each node.
+    texts (tuple[str, ...]): Each edge's parts joined with slashes, for comparing against a request path in one call.
+    children (tuple[dict[str, int], ...]): Maps the first part of each outgoing static edge to the child's number.
+    param_children (tuple[int, ...]): The number of each node's parameter child, or -1.
+    wildcard_children (tuple[int, ...]): The number of each node's wildcard child, or -1.
+    handlers (tuple[Optional[str], ...]): The handler stored at each node, if any.
+    param_names (tuple[tuple[str, ...], ...]): The names of the values captured on the way to each handler.
+    shapes (tuple[int, ...]): A number shared by nodes whose subtrees match exactly the same path suffixes.
+    static_routes (dict[str, str]): Maps every normalized route without parameters to its handler.
+    """
+    __slots__ = ("parts", "texts", "children", "param_children", "wildcard_children",
+                 "handlers", "param_names", "shapes", "static_routes")
+
+    def __init__(self, trie: RouteTrie):
+        """
+        Flatten a RouteTrie into a RouteTable.
+
+        Args:
+        trie (RouteTrie): The trie to flatten.
+        """
+        nodes = [trie.root]
+        numbers = {id(trie.root): 0}
+        # Number the nodes breadth first, appending children as they are seen
+        for node in nodes:
+            for child in node.children.values():
+                numbers[id(child)] = len(nodes)
+                nodes.append(child)
+            for child in (node.param_child, node.wildcard_child):
+                if child is not None:
+                    numbers[id(child)] = len(nodes)
+                    nodes.append(child)
+
+        no_children: dict[str, int] = {}
+        self.parts = tuple(node.parts for node in nodes)
+        self.texts = tuple("/".join(node.parts) for node in nodes)
+        self.children = tuple({key: numbers[id(child)] for key, child in node.children.items()}
+                              if node.children else no_children for node in nodes)
+        self.param_children = tuple(numbers[id(node.param_child)] if node.param_child is not None else -1
+                                    for node in nodes)
+        self.wildcard_children = tuple(numbers[id(node.wildcard_child)] if node.wildcard_child is not None else -1
+                                       for node in nodes)
+        self.handlers = tuple(node.handler for node in nodes)
+        self.param_names = tuple(node.param_names for node in nodes)
+        self.shapes = self._number_shapes()
+        self.static_routes = dict(trie.static_routes)
+
+    def _number_shapes(self) -> tuple[int, ...]:
+        """
+        Give nodes with structurally identical subtrees the same number.
+
+        Whether a subtree matches the rest of a path depends only on its edges
+        and on which of its nodes have handlers, not on the handlers or the
+        parameter names themselves. Children are numbered after their parents,
+        so the nodes are visited in reverse to number every child first.
+
+        Returns:
+        tuple[int, ...]: The shape number of each node.
+        """
+        shapes = [0] * len(self.handlers)
+        numbers: dict[tuple, int] = {}
+        for node in range(len(shapes) - 1, -1, -1):
+            param, wildcard = self.param_children[node], self.wildcard_children[node]
+            key = (self.handlers[node] is not None,
+                   tuple(sorted((self.texts[child], shapes[child]) for child in self.children[node].values())),
+                   shapes[param] if param >= 0 else -1,
+                   shapes[wildcard] if wildcard >= 0 else -1)
+            shapes[node] = numbers.setdefault(key, len(numbers))
+        return tuple(shapes)
+
+    def __len__(self) -> int:
+        """
+        Return the number of nodes in the table.
+
+        Returns:
+        int: The number of nodes.
+        """
+        return len(self.handlers)
+
+    def resolve(self, path: str) -> Optional[tuple[str, tuple[str, ...], Optional[tuple]]]:
+        """
+        Walk the table along a raw path string.
+
+        The path is scanned with index offsets instead of being split, and
+        runs of slashes are skipped as they are reached, so duplicate and
+        trailing slashes need no separate normalization pass. The only string
+        built is the key used to choose a child at a branching node; the
+        remaining parts of a compressed edge are compared in place.
+
+        At every node a static edge is tried first, then the parameter child,
+        then the wildcard child. The alternatives are only saved when a node
+        has them, and the walk backtracks to them when a preferred branch
+        dead-ends. Once backtracking has started, every (shape, offset) pair
+        whose subtree failed is remembered, and a node with the same shape is
+        not walked again from the same offset. Overlapping parameter routes
+        such as "/a/b" and "/:x/:y" have repeated shapes, so the work is
+        bounded by the number of distinct (shape, offset) pairs reached rather
+        than by the number of nodes matching a prefix of the path.
+
+        Args:
+        path (str): The request path.
+
+        Returns:
+        tuple[str, tuple[str, ...], Optional[tuple]] or None: The handler, the matched route's
+        parameter names and the captured (start, end, previous) offsets, or None if no route matches.
+        """
+        size = len(path)
+        children, param_children, wildcard_children = self.children, self.param_children, self.wildcard_children
+        node, position, captured = 0, 0, None
+        pending = failed = None
+        while True:
+            while position < size and path[position] == "/":
+                position += 1
+            if position == size:
+                handler = self.handlers[node]
+                if handler is not None:
+                    return handler, self.param_names[node], captured
+            elif pending is None or (self.shapes[node], position) not in failed:
+                if pending is not None:
+                    # Popped once everything below this node has failed
+                    pending.append((None, (self.shapes[node], position), None))
+                end = path.find("/", position)
+                if end == -1:
+                    end = size
+                param, wildcard = param_children[node], wildcard_children[node]
+                if param >= 0 or wildcard >= 0:
+                    if pending is None:
+                        pending, failed = [], set()
+                    # Save in reverse priority order so the parameter is retried first
+                    if wildcard >= 0:
+                        pending.append((wildcard, size, (position, size, captured)))
+                    if param >= 0:
+                        pending.append((param, end, (position, end, captured)))
+                child = children[node].get(path[position:end])
+                if child is not None:
+                    if len(self.parts[child]) > 1:
+                        end = self._match_edge(path, position, child)
+                    if end >= 0:
+                        node, position = child, end
+                        continue
+            while True:
+                if not pending:
+                    return None
+                node, position, captured = pending.pop()
+                if node is not None:
+                    break
+                failed.add(position)
+
+    def _match_edge(self, path: str, position: int, node: int) -> int:
+        """
+        Compare a compressed edge with the path, in place.
+
+        The whole edge is compared in one call first; the parts are only
+        compared one by one, skipping extra slashes, if that fails.
+
+        Args:
+        path (str): The request path.
+        position (int): The offset of the edge's first part in the path.
+        node (int): The number of the node the edge leads to.
+
+        Returns:
+        int: The offset just after the edge, or -1 if the path does not follow it.
+        """
+        size = len(path)
+        text = self.texts[node]
+        if path.startswith(text, position):
+            end = position + len(text)
+            if end == size or path[end] == "/":
+                return end
+        parts = self.parts[node]
+        position += len(parts[0])
+        index = 1
+        while index < len(parts):
+            while position < size and path[position] == "/":
+                position += 1
+            part = parts[index]
+            if not path.startswith(part, position):
+                return -1
+            position += len(part)
+            if position < size and path[position] != "/":
+                return -1
+            index += 1
+        return position
+
+def _captured_params(path: str, names: tuple[str, ...], captured: Optional[tuple]) -> dict[str, str]:
+    """
+    Pair parameter names with the values captured while walking a path.
+
+    Args:
+    path (str): The request path the offsets refer to.
+    names (tuple[str, ...]): The parameter names of the matched route, in order.
+    captured (Optional[tuple]): The captured (start, end, previous) offsets, last value first.
+
+    Returns:
+    dict[str, str]: A dictionary mapping each parameter name to its value.
+    """
+    values = []
+    while captured is not None:
+        start, end, captured = captured
+        value = path[start:end]
+        if "/" in value:
+            # A splat value: drop duplicate and trailing slashes
+            value = "/".join(part for part in value.split("/") if part)
+        values.append(value)
+    values.reverse()
+    return dict(zip(names, values))
 
 class Router:
     """
     A router to manage routes and their handlers using a RouteTrie.
 
+    Lookups read a snapshot: an immutable RouteTable compiled from the trie,
+    paired with LRU caches of recent results for that table, one per
+    thread. The snapshot is replaced with a single assignment, so readers
+    never take a lock and always see either the old route set or the new
+    one, never a mix. No cache is shared between threads, so each thread
+    may hold up to cache_size results.
+
+    Routes may contain ":param" parts, which match any single part, and a
+    final "*splat" part, which matches the rest of the path; the captured
+    values are returned by `match`.
+
     Attributes:
-    route_trie (RouteTrie): The trie used to store routes and handlers.
+    route_trie (RouteTrie): The trie the current route table is compiled from.
+    root_handler (str): The handler for the root route, kept across reloads.
     not_found_handler (str): The handler to return when a route is not found.
+    cache_size (int): The maximum number of cached lookup results per thread.
     """
-    def __init__(self, root_handler: str, not_found_handler: str):
+    def __init__(self, root_handler: str, not_found_handler: str, cache_size: int = 4096):
         """
         Initialize the Router with a root handler and a not-found handler.
 
         Args:
         root_handler (str): The handler for the root route.
         not_found_handler (str): The handler for routes that are not found.
+        cache_size (int): The maximum number of cached lookup results per thread.
         """
-        pass
+        self.route_trie = RouteTrie(root_handler)
+        self.root_handler = root_handler
+        self.not_found_handler = not_found_handler
+        self.cache_size = cache_size
+        self._lock = threading.Lock()
+        self._snapshot: Optional[tuple[RouteTable, threading.local]] = None
+
+    @property
+    def table(self) -> RouteTable:
+        """
+        The route table that lookups currently read.
+
+        Returns:
+        RouteTable: The current route table.
+        """
+        return self._current()[0]
 
     def add_handler(self, path: str, handler: str) -> None:
         """
         Add a handler for a route.
 
+        The route table is recompiled on the next lookup, so a batch of
+        routes is compiled once. To replace the routes of a router that is
+        serving requests, build the whole set with `reload` instead.
+
         Args:
-        path (str): The route path.
+        path (str): The route path, optionally with ":param" parts and a final "*splat" part.
         handler (str): The handler for the route.
         """
-        pass
+        path_parts = [sys.intern(part) for part in self.split_path(path)]
+        with self._lock:
+            self.route_trie.insert(path_parts, handler)
+            self._snapshot = None
+
+    def reload(self, routes: dict[str, str]) -> None:
+        """
+        Replace every route with a new set, without blocking lookups.
+
+        The new table is compiled on the side and then swapped in with a
+        single assignment. The root handler given to the constructor is kept
+        unless "/" is in `routes`.
+
+        Args:
+        routes (dict[str, str]): Maps each route path to its handler.
+        """
+        trie = RouteTrie(self.root_handler)
+        for path, handler in routes.items():
+            trie.insert([sys.intern(part) for part in self.split_path(path)], handler)
+        snapshot = (trie.compile(), threading.local())
+        with self._lock:
+            self.route_trie = trie
+            self._snapshot = snapshot
 
     def lookup(self, path: str) -> str:
         """
@@ -110,7 +536,78 @@ class Router:
         Returns:
         str: The handler for the route if found, otherwise the not-found handler.
         """
-        pass
+        return self._resolve(path)[0]
+
+    def match(self, path: str) -> tuple[str, dict[str, str]]:
+        """
+        Look up a route and return the associated handler with its captured values.
+
+        A static route always wins over a ":param" route, which wins over a
+        "*splat" route, at every part of the path.
+
+        Args:
+        path (str): The route path.
+
+        Returns:
+        tuple[str, dict[str, str]]: The handler and a dictionary of captured values,
+        or the not-found handler and an empty dictionary.
+        """
+        handler, names, captured = self._resolve(path)
+        return handler, _captured_params(path, names, captured)
+
+    def _current(self) -> tuple[RouteTable, threading.local]:
+        """
+        Return the current snapshot, compiling the trie if routes were added.
+
+        Returns:
+        tuple[RouteTable, threading.local]: The route table and its per-thread result caches.
+        """
+        snapshot = self._snapshot
+        if snapshot is None:
+            with self._lock:
+                snapshot = self._snapshot
+                if snapshot is None:
+                    snapshot = self._snapshot = (self.route_trie.compile(), threading.local())
+        return snapshot
+
+    def _resolve(self, path: str) -> tuple[str, tuple[str, ...], Optional[tuple]]:
+        """
+        Find the handler, parameter names and captured offsets for a path.
+
+        A path that is already normalized, such as "/home/about", is answered
+        by the static-route dictionary without building any new string.
+
+        Args:
+        path (str): The route path.
+
+        Returns:
+        tuple[str, tuple[str, ...], Optional[tuple]]: The handler, the matched route's
+        parameter names and the captured offsets.
+        """
+        if not path:
+            return self.not_found_handler, (), None
+        table, caches = self._current()
+        if self.cache_size:
+            # This thread's own cache for this table, so no other thread touches it
+            cache = getattr(caches, "cache", None)
+            if cache is None:
+                cache = caches.cache = OrderedDict()
+            result = cache.get(path)
+            if result is not None:
+                cache.move_to_end(path)
+                return result
+
+        handler = table.static_routes.get(path)
+        if handler is not None:
+            result = (handler, (), None)
+        else:
+            result = table.resolve(path) or (self.not_found_handler, (), None)
+
+        if self.cache_size:
+            cache[path] = result
+            if len(cache) > self.cache_size:
+                cache.popitem(last=False)
+        return result
 
     def split_path(self, path: str) -> list[str]:
         """
@@ -122,7 +619,7 @@ class Router:
         Returns:
             List[str]: A list of parts of the path.
         """
-        pass
+        return [part for part in path.split("/") if part]
 
 if __name__ == '__main__':
     # create the router and add a route
@@ -144,3 +641,197 @@ if __name__ == '__main__':
     # Normal case: Path with exact match
     print(router.lookup("/home/about"))
     # Expected output: 'about handler'
+
+    # Normal case: Root path and trailing slash
+    print(router.lookup("/"))
+    # Expected output: 'root handler'
+    print(router.lookup("/home/about/"))
+    # Expected output: 'about handler'
+
+    # Normal case: Compressed edges are split when routes diverge
+    router.add_handler("/home/about/team", "team handler")
+    router.add_handler("/home/blog", "blog handler")
+    print(router.lookup("/home/about/team"), router.lookup("/home/blog"), router.lookup("/home"))
+    # Expected output: 'team handler blog handler not found handler'
+    print(router.route_trie.find(["home", "about"]), router.route_trie.find(["home", "abo"]))
+    # Expected output: 'about handler None'
+
+    # Normal case: Parameters capture single parts and a splat captures the rest
+    router.add_handler("/users/:id", "user handler")
+    router.add_handler("/users/:id/posts/:post", "post handler")
+    router.add_handler("/files/*path", "file handler")
+    print(router.match("/users/42"))
+    # Expected output: ('user handler', {'id': '42'})
+    print(router.match("/users/42/posts/7/"))
+    # Expected output: ('post handler', {'id': '42', 'post': '7'})
+    print(router.match("/files/css/site.css"))
+    # Expected output: ('file handler', {'path': 'css/site.css'})
+    print(router.lookup("/files"), router.lookup("/users/42/posts"))
+    # Expected output: 'not found handler not found handler'
+
+    # Normal case: Static beats parameter beats wildcard, with backtracking
+    router.add_handler("/users/new", "new user handler")
+    router.add_handler("/users/new/settings", "settings handler")
+    router.add_handler("/users/*rest", "users fallback handler")
+    print(router.match("/users/new"), router.match("/users/new/posts/1"))
+    # Expected output: ('new user handler', {}) ('post handler', {'id': 'new', 'post': '1'})
+    print(router.match("/users/1/likes"))
+    # Expected output: ('users fallback handler', {'rest': '1/likes'})
+
+    # Edge case: A splat must be the last part of a route
+    try:
+        router.add_handler("/static/*path/edit", "bad handler")
+        print("Fail")
+    except ValueError:
+        print("Pass")
+    # Expected output: Pass
+
+    # Edge case: Duplicate and trailing slashes are skipped while walking
+    print(router.lookup("//home///about//"), router.match("/files//css//site.css/"))
+    # Expected output: about handler ('file handler', {'path': 'css/site.css'})
+
+    # Edge case: Backtracking out of long static and parameter branches
+    ambiguous = Router("root handler", "not found handler", cache_size=0)
+    for depth in range(1, 21):
+        ambiguous.add_handler("/" + "/".join(["a"] * depth) + "/end", f"static {depth}")
+        ambiguous.add_handler("/" + "/".join([":p"] * depth) + "/stop", f"param {depth}")
+    print(ambiguous.lookup("/" + "/".join(["a"] * 20) + "/missing"))
+    # Expected output: 'not found handler'
+
+    # Edge case: A miss among 2**14 overlapping routes reuses failed subtrees
+    import itertools
+    overlapping = Router("root handler", "not found handler", cache_size=0)
+    for choice in itertools.product((False, True), repeat=14):
+        parts = [f":p{index}" if is_param else "a" for index, is_param in enumerate(choice)]
+        overlapping.add_handler("/" + "/".join(parts), "".join("p" if is_param else "a" for is_param in choice))
+
+    class CountingNodes(tuple):
+        # Counts the nodes the walk expands, one children lookup each
+        expanded = 0
+        def __getitem__(self, node):
+            CountingNodes.expanded += 1
+            return super().__getitem__(node)
+
+    overlapping.table.children = CountingNodes(overlapping.table.children)
+    missed = overlapping.lookup("/a" * 15)
+    print(missed, overlapping.lookup("/a" * 14), overlapping.lookup("/a" * 13 + "/b"))
+    # Expected output: not found handler aaaaaaaaaaaaaa aaaaaaaaaaaaap
+    CountingNodes.expanded = 0
+    overlapping.lookup("/a" * 15 + "/miss")
+    print(CountingNodes.expanded <= 2 * 15)  # Expected output: True (2**15 - 1 nodes without the memo)
+
+    # Normal case: Reloading swaps in a complete new route set
+    reloaded = Router("root handler", "not found handler")
+    reloaded.add_handler("/home/about", "about handler")
+    reloaded.reload({"/v2/about": "v2 about handler", "/v2/users/:id": "v2 user handler"})
+    print(reloaded.lookup("/home/about"), reloaded.lookup("/v2/about"), reloaded.match("/v2/users/7"))
+    # Expected output: not found handler v2 about handler ('v2 user handler', {'id': '7'})
+    print(reloaded.lookup("/"))
+    # Expected output: 'root handler'
+    reloaded.reload({"/": "v3 root handler"})
+    print(reloaded.lookup("/"), end=" ")
+    reloaded.reload({"/v4/about": "v4 about handler"})
+    print(reloaded.lookup("/"))
+    # Expected output: v3 root handler root handler
+
+    # Benchmark: lookups/sec on a 50k-route table with a skewed request mix
+    import random
+    import time
+    import tracemalloc
+
+    def benchmark_routes(count: int) -> list[str]:
+        routes = []
+        for index in range(count):
+            version, service, resource = index % 3 + 1, index % 500, index // 500
+            routes.append(f"/api/v{version}/service-{service}/resource-{resource}/details")
+        return routes
+
+    routes = benchmark_routes(50000)
+    big_router = Router("root handler", "not found handler")
+    start = time.perf_counter()
+    for route in routes:
+        big_router.add_handler(route, "handler " + route)
+    big_router.table
+    build_time = time.perf_counter() - start
+    # 90% of requests go to the 1% most popular routes, 5% miss entirely
+    popular = routes[:500]
+    requests = [random.choice(popular) if random.random() < 0.9 else random.choice(routes)
+                for _ in range(200000)]
+    requests = [request + "/extra" if random.random() < 0.05 else request for request in requests]
+
+    def peak_bytes_per_lookup(function, requests: list[str]) -> float:
+        tracemalloc.start()
+        total = 0
+        for request in requests:
+            tracemalloc.reset_peak()
+            baseline = tracemalloc.get_traced_memory()[0]
+            function(request)
+            total += tracemalloc.get_traced_memory()[1] - baseline
+        tracemalloc.stop()
+        return total / len(requests)
+
+    def split_walk(request: str) -> str:
+        return big_router.route_trie.find(big_router.split_path(request)) or big_router.not_found_handler
+
+    def offset_walk(request: str) -> str:
+        found = big_router.table.resolve(request)
+        return found[0] if found is not None else big_router.not_found_handler
+
+    results = {}
+    for name, function in (("split then walk", split_walk), ("offset walk", offset_walk),
+                           ("router", big_router.lookup)):
+        start = time.perf_counter()
+        results[name] = [function(request) for request in requests]
+        elapsed = time.perf_counter() - start
+        peak = peak_bytes_per_lookup(function, requests[:20000])
+        print(f"{name}: {len(requests) / elapsed:.0f} lookups/s, {peak:.0f} peak bytes allocated per lookup")
+    print("Pass" if results["split then walk"] == results["offset walk"] == results["router"] else "Fail")
+    print(f"{len(routes)} routes built in {build_time:.2f}s")
+
+    # Benchmark: matches/s as the number of dynamic routes grows
+    for count in (100, 1000, 10000, 50000):
+        dynamic_router = Router("root handler", "not found handler", cache_size=0)
+        for index in range(count):
+            dynamic_router.add_handler(f"/api/service-{index}/:id/items/:item", f"handler {index}")
+        dynamic_router.add_handler("/api/:service/health", "health handler")
+        dynamic_router.table
+        dynamic_requests = [f"/api/service-{random.randrange(count)}/{index}/items/{index % 10}"
+                            for index in range(20000)]
+        start = time.perf_counter()
+        for request in dynamic_requests:
+            dynamic_router.match(request)
+        dynamic_time = time.perf_counter() - start
+        print(f"{count} dynamic routes: {len(dynamic_requests) / dynamic_time:.0f} matches/s")
+
+    # Benchmark: recompiling 50k routes while threads hammer lookups
+    import threading
+
+    route_sets = [{route: f"{name} {route}" for route in routes} for name in ("blue", "green")]
+    hammer_router = Router("root handler", "not found handler")
+    start = time.perf_counter()
+    hammer_router.reload(route_sets[0])
+    idle_time = time.perf_counter() - start
+    errors = []
+    stop = threading.Event()
+
+    def hammer() -> None:
+        while not stop.is_set():
+            route = random.choice(routes)
+            handler = hammer_router.lookup(route)
+            if handler not in (f"blue {route}", f"green {route}"):
+                errors.append((route, handler))
+
+    threads = [threading.Thread(target=hammer) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    reload_times = []
+    for reload_index in range(6):
+        start = time.perf_counter()
+        hammer_router.reload(route_sets[reload_index % 2])
+        reload_times.append(time.perf_counter() - start)
+    stop.set()
+    for thread in threads:
+        thread.join()
+    print("Pass" if not errors else f"Fail: {errors[:3]}")
+    print(f"{len(routes)} routes recompiled in {idle_time:.2f}s idle, {min(reload_times):.2f}s to "
+          f"{max(reload_times):.2f}s while {len(threads)} threads run lookups")
@@ -1,3 +1,303 @@
+from array import array
+from bisect import bisect_left
+from typing import Iterable, Iterator, Optional, Union
+
+
+class UserDirectory:
+    """
+    A class to intern user names into dense integer IDs.
+
+    Attributes:
+    -----------
+    ids : dict[str, int]
+        Maps every known user name to its integer ID.
+    names : list[str]
+        Maps every integer ID back to its user name.
+    """
+
+    def __init__(self) -> None:
+        """
+        Constructs an empty UserDirectory.
+        """
+        self.ids: dict[str, int] = {}
+        self.names: list[str] = []
+
+    def intern(self, user: str) -> int:
+        """
+        Return the ID of a user, assigning the next free one if it is new.
+
+        Parameters:
+        -----------
+        user : str
+            The user name to intern.
+
+        Returns:
+        --------
+        int
+            The integer ID of the user.
+        """
+        user_id = self.ids.get(user)
+        if user_id is None:
+            user_id = len(self.names)
+            self.ids[user] = user_id
+            self.names.append(user)
+        return user_id
+
+    def lookup(self, user: str) -> Optional[int]:
+        """
+        Return the ID of a user without interning it.
+
+        Parameters:
+        -----------
+        user : str
+            The user name to look up.
+
+        Returns:
+        --------
+        Optional[int]
+            The integer ID of the user, or None if it was never interned.
+        """
+        return self.ids.get(user)
+
+    def name(self, user_id: int) -> str:
+        """
+        Return the user name for an integer ID.
+
+        Parameters:
+        -----------
+        user_id : int
+            The ID to resolve.
+
+        Returns:
+        --------
+        str
+            The user name.
+        """
+        return self.names[user_id]
+
+
+# Shared by every Group so that IDs are comparable across groups
+USER_DIRECTORY = UserDirectory()
+
+# A container holds the low 16 bits of its values either as a sorted array of
+# uint16 (sparse) or as a 65536-bit Python int (dense), like Roaring bitmaps.
+Container = Union[array, int]
+ARRAY_LIMIT = 4096
+CHUNK_BITS = 16
+LOW_MASK = (1 << CHUNK_BITS) - 1
+
+
+def _to_bitmap(values: array) -> int:
+    buffer = bytearray(1 << (CHUNK_BITS - 3))
+    for value in values:
+        buffer[value >> 3] |= 1 << (value & 7)
+    return int.from_bytes(buffer, 'little')
+
+
+def _to_array(bits: int) -> array:
+    values = array('H')
+    for byte_index, byte in enumerate(bits.to_bytes(1 << (CHUNK_BITS - 3), 'little')):
+        while byte:
+            low_bit = byte & -byte
+            values.append(byte_index * 8 + low_bit.bit_length() - 1)
+            byte ^= low_bit
+    return values
+
+
+def _copy(container: Container) -> Container:
+    return container if isinstance(container, int) else array('H', container)
+
+
+def _normalize(container: Container) -> Container:
+    """
+    Store a container in whichever representation is smaller.
+    """
+    if isinstance(container, int):
+        if container.bit_count() <= ARRAY_LIMIT:
+            return _to_array(container)
+        return container
+    if len(container) > ARRAY_LIMIT:
+        return _to_bitmap(container)
+    return container
+
+
+def _merge_arrays(first: array, second: array, keep_all: bool) -> array:
+    """
+    Merge two sorted arrays as a union (keep_all) or an intersection.
+    """
+    result = array('H')
+    i = j = 0
+    while i < len(first) and j < len(second):
+        if first[i] < second[j]:
+            if keep_all:
+                result.append(first[i])
+            i += 1
+        elif first[i] > second[j]:
+            if keep_all:
+                result.append(second[j])
+            j += 1
+        else:
+            result.append(first[i])
+            i += 1
+            j += 1
+    if keep_all:
+        result.extend(first[i:])
+        result.extend(second[j:])
+    return result
+
+
+class RoaringBitmap:
+    """
+    A compressed set of non-negative integers.
+
+    Values are split by their high bits into chunks of 65536. Each chunk is
+    kept as a sorted uint16 array while it holds at most ARRAY_LIMIT values
+    and as a bitset otherwise, so unions and intersections run as bulk
+    merges or bitwise operations per chunk.
+
+    Attributes:
+    -----------
+    containers : dict[int, Container]
+        Maps the high bits of a value to the container of its low bits.
+    """
+
+    def __init__(self, values: Iterable[int] = ()) -> None:
+        """
+        Constructs a RoaringBitmap holding the given values.
+
+        Parameters:
+        -----------
+        values : Iterable[int]
+            The initial values of the bitmap.
+        """
+        self.containers: dict[int, Container] = {}
+        for value in values:
+            self.add(value)
+
+    def add(self, value: int) -> None:
+        """
+        Add a value to the bitmap.
+
+        Parameters:
+        -----------
+        value : int
+            The non-negative integer to add.
+        """
+        high, low = value >> CHUNK_BITS, value & LOW_MASK
+        container = self.containers.get(high)
+        if container is None:
+            self.containers[high] = array('H', [low])
+        elif isinstance(container, int):
+            self.containers[high] = container | (1 << low)
+        else:
+            position = bisect_left(container, low)
+            if position == len(container) or container[position] != low:
+                container.insert(position, low)
+                self.containers[high] = _normalize(container)
+
+    def __contains__(self, value: int) -> bool:
+        """
+        Check whether a value is in the bitmap.
+
+        Parameters:
+        -----------
+        value : int
+            The integer to check.
+
+        Returns:
+        --------
+        bool
+            True if the value is in the bitmap, False otherwise.
+        """
+        container = self.containers.get(value >> CHUNK_BITS)
+        if container is None:
+            return False
+        low = value & LOW_MASK
+        if isinstance(container, int):
+            return bool(container >> low & 1)
+        position = bisect_left(container, low)
+        return position < len(container) and container[position] == low
+
+    def __or__(self, other: 'RoaringBitmap') -> 'RoaringBitmap':
+        """
+        Return the union of two bitmaps.
+        """
+        result = RoaringBitmap()
+        # Arrays are mutated in place by add(), so the result gets its own copies
+        result.containers = {high: _copy(container) for high, container in self.containers.items()}
+        for high, container in other.containers.items():
+            mine = result.containers.get(high)
+            if mine is None:
+                result.containers[high] = _copy(container)
+            elif isinstance(mine, int) or isinstance(container, int):
+                mine = mine if isinstance(mine, int) else _to_bitmap(mine)
+                theirs = container if isinstance(container, int) else _to_bitmap(container)
+                result.containers[high] = mine | theirs
+            else:
+                result.containers[high] = _normalize(_merge_arrays(mine, container, True))
+        return result
+
+    def __and__(self, other: 'RoaringBitmap') -> 'RoaringBitmap':
+        """
+        Return the intersection of two bitmaps.
+        """
+        result = RoaringBitmap()
+        for high, container in self.containers.items():
+            theirs = other.containers.get(high)
+            if theirs is None:
+                continue
+            if isinstance(container, int) and isinstance(theirs, int):
+                common: Container = _normalize(container & theirs)
+            elif isinstance(container, int) or isinstance(theirs, int):
+                bits, values = (container, theirs) if isinstance(container, int) else (theirs, container)
+                common = array('H', (value for value in values if bits >> value & 1))
+            else:
+                common = _merge_arrays(container, theirs, False)
+            if common:
+                result.containers[high] = common
+        return result
+
+    def __len__(self) -> int:
+        """
+        Return the number of values in the bitmap.
+        """
+        return sum(container.bit_count() if isinstance(container, int) else len(container)
+                   for container in self.containers.values())
+
+    def __iter__(self) -> Iterator[int]:
+        """
+        Iterate over the values of the bitmap in ascending order.
+        """
+        for high in sorted(self.containers):
+            container = self.containers[high]
+            if isinstance(container, int):
+                container = _to_array(container)
+            base = high << CHUNK_BITS
+            for low in container:
+                yield base | low
+
+    def copy(self) -> 'RoaringBitmap':
+        """
+        Return a copy of the bitmap that shares no containers with it.
+        """
+        result = RoaringBitmap()
+        result.containers = {high: _copy(container) for high, container in self.containers.items()}
+        return result
+
+    def memory_size(self) -> int:
+        """
+        Estimate the number of bytes used by the containers' payloads.
+
+        Returns:
+        --------
+        int
+            Approximate payload size in bytes.
+        """
+        return sum(container.bit_length() // 8 + 1 if isinstance(container, int)
+                   else container.itemsize * len(container)
+                   for container in self.containers.values())
+
+
 class Group:
     """
     A class to represent a group which can contain sub-groups and users.
@@ -8,8 +308,8 @@ class Group:
         The name of the group.
     groups : list[Group]
         A list of sub-groups within this group.
-    users : list[str]
-        A list of users in this group.
+    user_ids : RoaringBitmap
+        The interned IDs of the users directly in this group.
     """
 
     def __init__(self, _name: str) -> None:
@@ -23,7 +323,9 @@ class Group:
         """
         self.name: str = _name
         self.groups: list[Group] = []
-        self.users: list[str] = []
+        self.user_ids: RoaringBitmap = RoaringBitmap()
+        self._parents: list[Group] = []
+        self._effective_members: Optional[RoaringBitmap] = None
 
     def add_group(self, group: 'Group') -> None:
         """
@@ -35,6 +337,8 @@ class Group:
             The sub-group to be added.
         """
         self.groups.append(group)
+        group._parents.append(self)
+        self._invalidate()
 
     def add_user(self, user: str) -> None:
         """
@@ -45,7 +349,8 @@ class Group:
         user : str
             The user to be added.
         """
-        self.users.append(user)
+        self.user_ids.add(USER_DIRECTORY.intern(user))
+        self._invalidate()
 
     def get_groups(self) -> list['Group']:
         """
@@ -62,12 +367,15 @@ class Group:
         """
         Get the list of users in this group.
 
+        The names are resolved from the group's bitmap of user IDs, so they
+        come back in interning order, without duplicates.
+
         Returns:
         --------
         list[str]
             A list of users.
         """
-        return self.users
+        return [USER_DIRECTORY.name(user_id) for user_id in self.user_ids]
 
     def get_name(self) -> str:
         """
@@ -80,6 +388,82 @@ class Group:
         """
         return self.name
 
+    def get_effective_members(self) -> RoaringBitmap:
+        """
+        Get the IDs of every user in this group or any of its sub-groups.
+
+        The sub-groups are walked with an explicit stack, so deep nesting
+        cannot reach the recursion limit. The result is cached on this group
+        only, not on the sub-groups visited to build it, and is rebuilt after
+        this group or one of its descendants changes.
+
+        Returns:
+        --------
+        RoaringBitmap
+            The interned IDs of all effective members.
+        """
+        if self._effective_members is not None:
+            return self._effective_members
+
+        # Unions of the sub-groups, built bottom up and dropped afterwards
+        unions: dict[int, RoaringBitmap] = {}
+        stack: list[tuple[Group, bool]] = [(self, False)]
+        while stack:
+            group, expanded = stack.pop()
+            if id(group) in unions:
+                continue
+            if not expanded:
+                stack.append((group, True))
+                stack.extend((sub_group, False) for sub_group in group.groups
+                             if id(sub_group) not in unions)
+                continue
+            members = group.user_ids.copy()
+            for sub_group in group.groups:
+                cached = sub_group._effective_members
+                members = members | (cached if cached is not None else unions[id(sub_group)])
+            unions[id(group)] = members
+        self._effective_members = unions[id(self)]
+        return self._effective_members
+
+    def _invalidate(self) -> None:
+        """
+        Drop the cached effective members of this group and its ancestors.
+
+        Groups between a cached ancestor and this one hold no cache of their
+        own, so the walk visits every ancestor rather than stopping early.
+        """
+        seen = {id(self)}
+        stack = [self]
+        while stack:
+            group = stack.pop()
+            group._effective_members = None
+            for parent in group._parents:
+                if id(parent) not in seen:
+                    seen.add(id(parent))
+                    stack.append(parent)
+
+
+def common_members(*groups: Group) -> list[str]:
+    """
+    Return the users that are effective members of every given group.
+
+    Parameters:
+    -----------
+    groups : Group
+        The groups to intersect.
+
+    Returns:
+    --------
+    list[str]
+        The names of the common users, in interning order.
+    """
+    if not groups:
+        return []
+    members = groups[0].get_effective_members()
+    for group in groups[1:]:
+        members = members & group.get_effective_members()
+    return [USER_DIRECTORY.name(user_id) for user_id in members]
+
 
 def is_user_in_group(user: str, group: Group) -> bool:
     """
@@ -97,22 +481,13 @@ def is_user_in_group(user: str, group: Group) -> bool:
     bool
         True if the user is found in the group or any sub-group, False otherwise.
     """
-    if user is None:
+    if user is None or group is None:
         return False
 
-    # Use a stack to implement an iterative depth-first search
-    stack = [group]
-
-    while stack:
-        current_group = stack.pop()
-        # Check if the user is directly in this group
-        if user in current_group.get_users():
-            return True
-
-        # Add all subgroups to the stack for further exploration
-        stack.extend(current_group.get_groups())
-
-    return False
+    user_id = USER_DIRECTORY.lookup(user)
+    if user_id is None:
+        return False
+    return user_id in group.get_effective_members()
 
 if __name__ == "__main__":
     # Testing the implementation
@@ -180,3 +555,81 @@ if __name__ == "__main__":
 
     print("Test Case 10")
     print(is_user_in_group("deep_user", deep_parent))  # Expected output: True
+
+    # Test Case 11: Effective members are refreshed after a nested change
+    level_4.add_user("new_deep_user")
+    print("Test Case 11")
+    print(is_user_in_group("new_deep_user", deep_parent))  # Expected output: True
+
+    # Test Case 12: Users common to two overlapping groups
+    team_a = Group("team_a")
+    team_b = Group("team_b")
+    shared = Group("shared")
+    shared.add_user("shared_user")
+    team_a.add_group(shared)
+    team_b.add_group(shared)
+    team_a.add_user("only_a")
+    team_b.add_user("only_b")
+    print("Test Case 12")
+    print(common_members(team_a, team_b))  # Expected output: ['shared_user']
+
+    # Test Case 13: Large directory, bitmap memory and query latency against
+    # a depth-first scan of per-group user lists
+    import sys
+    import time
+
+    def list_based_lookup(user: str, group: Group, user_lists: dict[int, list[str]]) -> bool:
+        stack = [group]
+        while stack:
+            current_group = stack.pop()
+            if user in user_lists[id(current_group)]:
+                return True
+            stack.extend(current_group.get_groups())
+        return False
+
+    company = Group("company")
+    for department_index in range(20):
+        department = Group(f"department_{department_index}")
+        for user_index in range(10000):
+            department.add_user(f"user_{department_index}_{user_index}")
+        company.add_group(department)
+
+    members = company.get_effective_members()
+    all_groups = [company, *company.get_groups()]
+    user_lists = {id(group): group.get_users() for group in all_groups}
+    # Both sides hold each group's direct users; the name strings themselves
+    # are kept by the directory either way and are not counted
+    list_bytes = sum(sys.getsizeof(user_list) for user_list in user_lists.values())
+    bitmap_bytes = sum(group.user_ids.memory_size() for group in all_groups)
+    print("Test Case 13")
+    print(len(members) == 200000)  # Expected output: True
+    print(f"direct users of all {len(all_groups)} groups: lists {list_bytes} bytes, "
+          f"bitmaps {bitmap_bytes} bytes; cached company union {members.memory_size()} bytes")
+
+    queries = [f"user_{index % 20}_{index * 7 % 10000}" for index in range(200)]
+    start = time.perf_counter()
+    list_results = [list_based_lookup(user, company, user_lists) for user in queries]
+    list_time = time.perf_counter() - start
+    start = time.perf_counter()
+    bitmap_results = [is_user_in_group(user, company) for user in queries]
+    bitmap_time = time.perf_counter() - start
+    print(list_results == bitmap_results)  # Expected output: True
+    print(f"list-based: {list_time / len(queries) * 1e6:.1f} us/query, "
+          f"bitmap: {bitmap_time / len(queries) * 1e6:.1f} us/query")
+
+    # Test Case 14: Nesting deeper than the recursion limit
+    deepest = Group("level_0")
+    deepest.add_user("bottom_user")
+    for depth in range(1, 1500):
+        outer = Group(f"level_{depth}")
+        outer.add_group(deepest)
+        deepest = outer
+    print("Test Case 14")
+    print(is_user_in_group("bottom_user", deepest))  # Expected output: True
+
+    # Test Case 15: A leaf group's cached members do not share its own bitmap
+    leaf = Group("leaf")
+    leaf.add_user("leaf_user")
+    cached = leaf.get_effective_members()
+    print("Test Case 15")
+    print(cached is not leaf.user_ids, leaf.get_users())  # Expected output: True ['leaf_user']
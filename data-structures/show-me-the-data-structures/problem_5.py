@@ -1,5 +1,284 @@
+import collections
 import hashlib
 import datetime
+import itertools
+import multiprocessing
+import os
+import queue
+import struct
+from concurrent.futures import ProcessPoolExecutor
+from typing import Iterator, Optional, Union
+
+
+def hash_block_fields(timestamp: datetime.datetime, data: str, previous_hash: str) -> str:
+    """
+    Calculate the SHA-256 hash of the fields of a block.
+
+    Parameters:
+    -----------
+    timestamp : datetime.datetime
+        The timestamp when the block was created.
+    data : str
+        The data stored in the block.
+    previous_hash : str
+        The hash of the previous block in the chain.
+
+    Returns:
+    --------
+    str
+        The hexadecimal hash of the block.
+    """
+    sha = hashlib.sha256()
+    hash_str = (str(timestamp) + str(data) + str(previous_hash)).encode('utf-8')
+    sha.update(hash_str)
+    return sha.hexdigest()
+
+
+def _hash_chunk(blocks: list['Block']) -> list[str]:
+    """
+    Hash a chunk of blocks; runs inside the worker processes.
+    """
+    return [block.calc_hash() for block in blocks]
+
+
+# Blocks are sent to the validation workers in batches of this size, and only
+# a few batches per worker are in flight, so a full validation holds a bounded
+# number of blocks in memory however long the chain is.
+VALIDATION_CHUNK = 1024
+
+
+def _hash_in_parallel(blocks: Iterator['Block'], workers: int) -> Iterator[tuple['Block', str]]:
+    """
+    Yield (block, hash) pairs in chain order, hashing batches in a process pool.
+    """
+    batches = iter(lambda: list(itertools.islice(blocks, VALIDATION_CHUNK)), [])
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        pending = collections.deque()
+        for batch in itertools.islice(batches, workers * 2):
+            pending.append((batch, executor.submit(_hash_chunk, batch)))
+        try:
+            while pending:
+                batch, future = pending.popleft()
+                hashes = future.result()
+                # Keep the pool busy while this batch is checked
+                for next_batch in itertools.islice(batches, 1):
+                    pending.append((next_batch, executor.submit(_hash_chunk, next_batch)))
+                yield from zip(batch, hashes)
+        finally:
+            # The caller stopped at an invalid block: drop the batches not started
+            for _, future in pending:
+                future.cancel()
+
+
+# Nonces are searched in chunks; workers take turns over consecutive chunks
+# so their ranges never overlap, and check for cancellation between chunks.
+MINING_CHUNK = 1 << 14
+# The difficulty and nonce are hashed as fixed-width fields, so no two
+# (difficulty, nonce) pairs produce the same bytes.
+DIFFICULTY_FIELD = struct.Struct('>H')
+NONCE_FIELD = struct.Struct('>Q')
+# How often the mining parent checks for workers that died without a result.
+MINING_POLL_SECONDS = 0.1
+
+
+def _scan_nonces(state: 'hashlib._Hash', target: int, start: int, end: int) -> int:
+    """
+    Try every nonce in [start, end) against a pre-seeded SHA-256 state.
+    """
+    for nonce in range(start, end):
+        sha = state.copy()
+        sha.update(NONCE_FIELD.pack(nonce))
+        if int.from_bytes(sha.digest(), 'big') < target:
+            return nonce
+    return -1
+
+
+def _mine_worker(prefix: bytes, difficulty: int, worker: int, workers: int, max_nonce: Optional[int],
+                 found: Optional['multiprocessing.synchronize.Event']) -> int:
+    """
+    Search the chunks of the nonce space owned by one worker.
+    """
+    state = hashlib.sha256(prefix)
+    target = 1 << (256 - difficulty)
+    first, step = worker * MINING_CHUNK, workers * MINING_CHUNK
+    starts = itertools.count(first, step) if max_nonce is None else range(first, max_nonce, step)
+    for start in starts:
+        if found is not None and found.is_set():
+            break
+        end = start + MINING_CHUNK if max_nonce is None else min(start + MINING_CHUNK, max_nonce)
+        nonce = _scan_nonces(state, target, start, end)
+        if nonce != -1:
+            if found is not None:
+                found.set()
+            return nonce
+    return -1
+
+
+def _mine_process(prefix: bytes, difficulty: int, worker: int, workers: int, max_nonce: Optional[int],
+                  found: 'multiprocessing.synchronize.Event', results: 'multiprocessing.Queue') -> None:
+    """
+    Run one mining worker in a child process and report its nonce or error.
+    """
+    try:
+        results.put(_mine_worker(prefix, difficulty, worker, workers, max_nonce, found))
+    except Exception as error:
+        found.set()
+        results.put(error)
+
+
+def mine_nonce(prefix: bytes, difficulty: int, workers: int = 1, max_nonce: Optional[int] = None) -> int:
+    """
+    Find a nonce whose hash, appended to prefix, has difficulty leading zero bits.
+
+    The SHA-256 state of the prefix is computed once, so every attempt only
+    hashes the nonce. With more than one worker the nonce space is split
+    into disjoint chunks across processes, and all of them stop as soon as
+    one finds a valid nonce.
+
+    Parameters:
+    -----------
+    prefix : bytes
+        The block contents that precede the nonce.
+    difficulty : int
+        The number of leading zero bits the hash must have.
+    workers : int
+        The number of worker processes.
+    max_nonce : Optional[int]
+        Stop searching at this nonce; None searches until a nonce is found.
+
+    Returns:
+    --------
+    int
+        A valid nonce, or -1 if none exists below max_nonce.
+
+    Raises:
+    -------
+    ValueError
+        If difficulty is not between 0 and 256.
+    RuntimeError
+        If a worker process fails or dies before reporting a result.
+    """
+    if not 0 <= difficulty <= 256:
+        raise ValueError(f"difficulty must be between 0 and 256, not {difficulty}")
+    if workers <= 1:
+        return _mine_worker(prefix, difficulty, 0, 1, max_nonce, None)
+
+    found = multiprocessing.Event()
+    results = multiprocessing.Queue()
+    processes = [multiprocessing.Process(target=_mine_process,
+                                         args=(prefix, difficulty, worker, workers, max_nonce, found, results))
+                 for worker in range(workers)]
+    for process in processes:
+        process.start()
+    nonce = -1
+    remaining = len(processes)
+    try:
+        while remaining:
+            try:
+                result = results.get(timeout=MINING_POLL_SECONDS)
+            except queue.Empty:
+                # A worker that exits normally has already queued its result
+                dead = [process for process in processes if process.exitcode not in (None, 0)]
+                if dead and nonce != -1:
+                    break
+                if dead:
+                    raise RuntimeError(f"mining worker exited with code {dead[0].exitcode}")
+                continue
+            remaining -= 1
+            if isinstance(result, Exception):
+                raise RuntimeError("mining worker failed") from result
+            if result != -1 and nonce == -1:
+                nonce = result
+                found.set()
+    finally:
+        found.set()
+        for process in processes:
+            process.join()
+    return nonce
+
+
+# Leaves and inner nodes are hashed with different prefixes so that an inner
+# node can never be passed off as a transaction. The root of an empty tree
+# has a prefix of its own, so it is not the leaf hash of an empty transaction.
+LEAF_PREFIX = b'\x00'
+NODE_PREFIX = b'\x01'
+EMPTY_PREFIX = b'\x02'
+
+
+def _merkle_levels(transactions: list[str]) -> list[list[bytes]]:
+    """
+    Build every level of the Merkle tree, from the leaves up to the root.
+
+    Leaves are hashed in one batch from a SHA-256 state that already holds
+    the leaf prefix. A node without a sibling is promoted unchanged to the
+    next level.
+    """
+    leaf_state = hashlib.sha256(LEAF_PREFIX)
+    level = []
+    for transaction in transactions:
+        sha = leaf_state.copy()
+        sha.update(transaction.encode('utf-8'))
+        level.append(sha.digest())
+    if not level:
+        return [[hashlib.sha256(EMPTY_PREFIX).digest()]]
+
+    levels = [level]
+    node_state = hashlib.sha256(NODE_PREFIX)
+    while len(level) > 1:
+        parents = []
+        for i in range(0, len(level) - 1, 2):
+            sha = node_state.copy()
+            sha.update(level[i] + level[i + 1])
+            parents.append(sha.digest())
+        if len(level) % 2:
+            parents.append(level[-1])
+        level = parents
+        levels.append(level)
+    return levels
+
+
+def merkle_root(transactions: list[str]) -> str:
+    """
+    Calculate the Merkle root of a list of transactions.
+
+    Parameters:
+    -----------
+    transactions : list[str]
+        The transactions to commit to.
+
+    Returns:
+    --------
+    str
+        The hexadecimal Merkle root.
+    """
+    return _merkle_levels(transactions)[-1][0].hex()
+
+
+def verify_merkle_proof(transaction: str, proof: list[tuple[str, bool]], root: str) -> bool:
+    """
+    Check that a transaction is committed to by a Merkle root.
+
+    Parameters:
+    -----------
+    transaction : str
+        The transaction to check.
+    proof : list[tuple[str, bool]]
+        The sibling hashes from the leaf up to the root, each with a flag that
+        is True when the sibling is on the left.
+    root : str
+        The hexadecimal Merkle root.
+
+    Returns:
+    --------
+    bool
+        True if the proof leads from the transaction to the root.
+    """
+    node = hashlib.sha256(LEAF_PREFIX + transaction.encode('utf-8')).digest()
+    for sibling_hash, sibling_is_left in proof:
+        sibling = bytes.fromhex(sibling_hash)
+        pair = sibling + node if sibling_is_left else node + sibling
+        node = hashlib.sha256(NODE_PREFIX + pair).digest()
+    return node.hex() == root
 
 class Block:
     """
@@ -14,8 +293,17 @@ class Block:
     previous_hash : str
         The hash of the previous block in the chain.
     hash : str
-        The hash of the current block.
+        The hash of the current block, computed once on construction.
+
+    Blocks are immutable: their fields cannot be reassigned after the hash
+    has been computed, so the stored hash always matches the contents.
     """
+    __slots__ = ('timestamp', 'data', 'previous_hash', 'hash')
+
+    timestamp: datetime.datetime
+    data: str
+    previous_hash: str
+    hash: str
 
     def __init__(self, timestamp: datetime.datetime, data: str, previous_hash: str) -> None:
         """
@@ -30,24 +318,94 @@ class Block:
         previous_hash : str
             The hash of the previous block in the chain.
         """
-        self.timestamp: datetime.datetime = timestamp
-        self.data: str = data
-        self.previous_hash: str = previous_hash
-        self.hash: str = self.calc_hash()
+        object.__setattr__(self, 'timestamp', timestamp)
+        object.__setattr__(self, 'data', data)
+        object.__setattr__(self, 'previous_hash', previous_hash)
+        object.__setattr__(self, 'hash', self.calc_hash())
+
+    @classmethod
+    def restore(cls, timestamp: datetime.datetime, data: str, previous_hash: str, block_hash: str) -> 'Block':
+        """
+        Rebuild a stored block without re-hashing its payload.
+
+        The stored hash is trusted as-is; Blockchain.validate() detects a
+        block whose contents no longer match it.
+
+        Parameters:
+        -----------
+        timestamp : datetime.datetime
+            The timestamp when the block was created.
+        data : str
+            The data stored in the block.
+        previous_hash : str
+            The hash of the previous block in the chain.
+        block_hash : str
+            The hash stored for the block.
+
+        Returns:
+        --------
+        Block
+            The restored block.
+        """
+        block = cls.__new__(cls)
+        object.__setattr__(block, 'timestamp', timestamp)
+        object.__setattr__(block, 'data', data)
+        object.__setattr__(block, 'previous_hash', previous_hash)
+        object.__setattr__(block, 'hash', block_hash)
+        return block
+
+    def has_valid_work(self) -> bool:
+        """
+        Check the block's proof of work; plain blocks require none.
+
+        Returns:
+        --------
+        bool
+            Always True.
+        """
+        return True
+
+    def __reduce__(self) -> tuple:
+        """
+        Pickle the block by its fields, as assignment is disabled.
+        """
+        return (Block.restore, (self.timestamp, self.data, self.previous_hash, self.hash))
+
+    def __setattr__(self, name: str, value: object) -> None:
+        """
+        Reject attribute assignment, as blocks are immutable.
+
+        Raises:
+        -------
+        AttributeError
+            Always.
+        """
+        raise AttributeError(f"Block is immutable, cannot set '{name}'")
+
+    def __delattr__(self, name: str) -> None:
+        """
+        Reject attribute deletion, as blocks are immutable.
+
+        Raises:
+        -------
+        AttributeError
+            Always.
+        """
+        raise AttributeError(f"Block is immutable, cannot delete '{name}'")
 
     def calc_hash(self) -> str:
         """
         Calculate the hash of the block using SHA-256.
 
+        This re-hashes the whole payload; use the stored hash attribute
+        unless the block is being verified.
+
         Returns:
         --------
         str
             The hash of the block.
         """
-        sha = hashlib.sha256()
-        hash_str = (str(self.timestamp) + str(self.data) + str(self.previous_hash)).encode('utf-8')
-        sha.update(hash_str)
-        return sha.hexdigest()
+        return hash_block_fields(self.timestamp, self.data, self.previous_hash)
 
     def __repr__(self) -> str:
         """
@@ -65,22 +423,601 @@ class Block:
                 f"  Hash: {self.hash}\n"
                 f")\n")
 
+class MerkleBlock(Block):
+    """
+    A block that carries a list of transactions committed to by a Merkle root.
+
+    The Merkle root is stored as the block's data, so the block hash covers
+    every transaction while a single transaction can be proven to be in the
+    block with O(log n) hashes.
+
+    Attributes:
+    -----------
+    transactions : tuple[str, ...]
+        The transactions in the block.
+    """
+    __slots__ = ('transactions', '_levels')
+
+    transactions: tuple[str, ...]
+
+    def __init__(self, timestamp: datetime.datetime, transactions: list[str], previous_hash: str) -> None:
+        """
+        Constructs a MerkleBlock and commits to its transactions.
+
+        Parameters:
+        -----------
+        timestamp : datetime.datetime
+            The timestamp when the block was created.
+        transactions : list[str]
+            The transactions stored in the block.
+        previous_hash : str
+            The hash of the previous block in the chain.
+        """
+        object.__setattr__(self, 'transactions', tuple(transactions))
+        object.__setattr__(self, '_levels', _merkle_levels(list(self.transactions)))
+        root = self._levels[-1][0].hex()
+        # Hash the header directly; calc_hash() would rebuild the whole tree
+        object.__setattr__(self, 'timestamp', timestamp)
+        object.__setattr__(self, 'data', root)
+        object.__setattr__(self, 'previous_hash', previous_hash)
+        object.__setattr__(self, 'hash', hash_block_fields(timestamp, root, previous_hash))
+
+    @classmethod
+    def restore_transactions(cls, timestamp: datetime.datetime, transactions: list[str], root: str,
+                             previous_hash: str, block_hash: str) -> 'MerkleBlock':
+        """
+        Rebuild a stored MerkleBlock without re-hashing its transactions.
+
+        Parameters:
+        -----------
+        timestamp : datetime.datetime
+            The timestamp when the block was created.
+        transactions : list[str]
+            The transactions stored in the block.
+        root : str
+            The Merkle root stored for the block.
+        previous_hash : str
+            The hash of the previous block in the chain.
+        block_hash : str
+            The hash stored for the block.
+
+        Returns:
+        --------
+        MerkleBlock
+            The restored block.
+        """
+        block = cls.restore(timestamp, root, previous_hash, block_hash)
+        object.__setattr__(block, 'transactions', tuple(transactions))
+        object.__setattr__(block, '_levels', None)
+        return block
+
+    def __reduce__(self) -> tuple:
+        """
+        Pickle the block by its fields, as assignment is disabled.
+        """
+        return (MerkleBlock.restore_transactions,
+                (self.timestamp, self.transactions, self.data, self.previous_hash, self.hash))
+
+    def calc_hash(self) -> str:
+        """
+        Calculate the hash of the block, re-hashing every transaction.
+
+        Returns:
+        --------
+        str
+            The hash of the block.
+        """
+        return hash_block_fields(self.timestamp, merkle_root(list(self.transactions)), self.previous_hash)
+
+    def merkle_proof(self, index: int) -> list[tuple[str, bool]]:
+        """
+        Build the inclusion proof of the transaction at an index.
+
+        Parameters:
+        -----------
+        index : int
+            The index of the transaction in the block.
+
+        Returns:
+        --------
+        list[tuple[str, bool]]
+            The proof to pass to verify_merkle_proof with the block's data.
+        """
+        if self._levels is None:
+            object.__setattr__(self, '_levels', _merkle_levels(list(self.transactions)))
+        proof = []
+        for level in self._levels[:-1]:
+            sibling = index ^ 1
+            if sibling < len(level):
+                proof.append((level[sibling].hex(), sibling < index))
+            index //= 2
+        return proof
+
+class ProofOfWorkBlock(Block):
+    """
+    A block whose hash must have a number of leading zero bits.
+
+    The hash covers the timestamp, data, previous hash, difficulty and a
+    nonce found by mining.
+
+    Attributes:
+    -----------
+    difficulty : int
+        The number of leading zero bits the hash must have.
+    nonce : int
+        The nonce that satisfies the difficulty.
+    """
+    __slots__ = ('difficulty', 'nonce')
+
+    difficulty: int
+    nonce: int
+
+    def __init__(self, timestamp: datetime.datetime, data: str, previous_hash: str,
+                 difficulty: int, workers: int = 1) -> None:
+        """
+        Constructs a ProofOfWorkBlock and mines its nonce.
+
+        Parameters:
+        -----------
+        timestamp : datetime.datetime
+            The timestamp when the block was created.
+        data : str
+            The data stored in the block.
+        previous_hash : str
+            The hash of the previous block in the chain.
+        difficulty : int
+            The number of leading zero bits the hash must have.
+        workers : int
+            The number of processes to mine with.
+        """
+        object.__setattr__(self, 'timestamp', timestamp)
+        object.__setattr__(self, 'data', data)
+        object.__setattr__(self, 'previous_hash', previous_hash)
+        object.__setattr__(self, 'difficulty', difficulty)
+        object.__setattr__(self, 'nonce', mine_nonce(self._prefix(), difficulty, workers))
+        object.__setattr__(self, 'hash', self.calc_hash())
+
+    @classmethod
+    def restore_work(cls, timestamp: datetime.datetime, data: str, previous_hash: str,
+                     difficulty: int, nonce: int, block_hash: str) -> 'ProofOfWorkBlock':
+        """
+        Rebuild a stored ProofOfWorkBlock without mining it again.
+
+        Parameters:
+        -----------
+        timestamp : datetime.datetime
+            The timestamp when the block was created.
+        data : str
+            The data stored in the block.
+        previous_hash : str
+            The hash of the previous block in the chain.
+        difficulty : int
+            The number of leading zero bits the hash must have.
+        nonce : int
+            The mined nonce.
+        block_hash : str
+            The hash stored for the block.
+
+        Returns:
+        --------
+        ProofOfWorkBlock
+            The restored block.
+        """
+        block = cls.restore(timestamp, data, previous_hash, block_hash)
+        object.__setattr__(block, 'difficulty', difficulty)
+        object.__setattr__(block, 'nonce', nonce)
+        return block
+
+    def __reduce__(self) -> tuple:
+        """
+        Pickle the block by its fields, as assignment is disabled.
+        """
+        return (ProofOfWorkBlock.restore_work, (self.timestamp, self.data, self.previous_hash,
+                                                self.difficulty, self.nonce, self.hash))
+
+    def _prefix(self) -> bytes:
+        return ((str(self.timestamp) + str(self.data) + str(self.previous_hash)).encode('utf-8')
+                + DIFFICULTY_FIELD.pack(self.difficulty))
+
+    def calc_hash(self) -> str:
+        """
+        Calculate the hash of the block, including its nonce.
+
+        Returns:
+        --------
+        str
+            The hash of the block.
+        """
+        return hashlib.sha256(self._prefix() + NONCE_FIELD.pack(self.nonce)).hexdigest()
+
+    def has_valid_work(self) -> bool:
+        """
+        Check that the stored hash has the required leading zero bits.
+
+        Returns:
+        --------
+        bool
+            True if the hash satisfies the difficulty.
+        """
+        return int(self.hash, 16) < 1 << (256 - self.difficulty)
+
+# Segment records are a length prefix followed by the block kind, the field
+# lengths and the timestamp, previous hash, hash and data bytes. MerkleBlock
+# records then hold each transaction with its own length prefix, and
+# ProofOfWorkBlock records hold the difficulty and nonce before the data.
+RECORD_HEADER = struct.Struct('>I')
+FIELDS_HEADER = struct.Struct('>BHHH')
+TRANSACTION_HEADER = struct.Struct('>I')
+WORK_HEADER = struct.Struct('>HQ')
+PLAIN_BLOCK = 0
+MERKLE_BLOCK = 1
+WORK_BLOCK = 2
+MERKLE_ROOT_SIZE = 64
+# Index entries are the record offset and the raw 32-byte block hash.
+INDEX_ENTRY = struct.Struct('>Q32s')
+# The hash table file starts with the number of heights it holds, followed by
+# a power-of-two number of slots, each 0 or a height plus one.
+HASH_HEADER = struct.Struct('>Q')
+HASH_SLOT = struct.Struct('>Q')
+HASH_TABLE_MIN = 1024
+
+
+def _encode_block(block: Block) -> bytes:
+    timestamp = block.timestamp.isoformat().encode('ascii')
+    previous_hash = block.previous_hash.encode('ascii')
+    block_hash = block.hash.encode('ascii')
+    if isinstance(block, MerkleBlock):
+        kind = MERKLE_BLOCK
+    elif isinstance(block, ProofOfWorkBlock):
+        kind = WORK_BLOCK
+    else:
+        kind = PLAIN_BLOCK
+    parts = [FIELDS_HEADER.pack(kind, len(timestamp), len(previous_hash), len(block_hash)),
+             timestamp, previous_hash, block_hash]
+    if kind == WORK_BLOCK:
+        parts.append(WORK_HEADER.pack(block.difficulty, block.nonce))
+    parts.append(block.data.encode('utf-8'))
+    if kind == MERKLE_BLOCK:
+        for transaction in block.transactions:
+            encoded = transaction.encode('utf-8')
+            parts.append(TRANSACTION_HEADER.pack(len(encoded)))
+            parts.append(encoded)
+    body = b''.join(parts)
+    return RECORD_HEADER.pack(len(body)) + body
+
+
+def _decode_block(body: bytes) -> Block:
+    kind, timestamp_size, previous_hash_size, hash_size = FIELDS_HEADER.unpack_from(body)
+    position = FIELDS_HEADER.size
+    timestamp = body[position:position + timestamp_size].decode('ascii')
+    position += timestamp_size
+    previous_hash = body[position:position + previous_hash_size].decode('ascii')
+    position += previous_hash_size
+    block_hash = body[position:position + hash_size].decode('ascii')
+    position += hash_size
+    if kind == MERKLE_BLOCK:
+        root = body[position:position + MERKLE_ROOT_SIZE].decode('ascii')
+        position += MERKLE_ROOT_SIZE
+        transactions = []
+        while position < len(body):
+            (transaction_size,) = TRANSACTION_HEADER.unpack_from(body, position)
+            position += TRANSACTION_HEADER.size
+            transactions.append(body[position:position + transaction_size].decode('utf-8'))
+            position += transaction_size
+        return MerkleBlock.restore_transactions(datetime.datetime.fromisoformat(timestamp), transactions,
+                                                root, previous_hash, block_hash)
+    if kind == WORK_BLOCK:
+        difficulty, nonce = WORK_HEADER.unpack_from(body, position)
+        position += WORK_HEADER.size
+        return ProofOfWorkBlock.restore_work(datetime.datetime.fromisoformat(timestamp),
+                                             body[position:].decode('utf-8'), previous_hash,
+                                             difficulty, nonce, block_hash)
+    return Block.restore(datetime.datetime.fromisoformat(timestamp), body[position:].decode('utf-8'),
+                         previous_hash, block_hash)
+
+
+class BlockStore:
+    """
+    A class to persist blocks in an append-only segment file.
+
+    Each block is written as a length-prefixed binary record. A companion
+    index file holds one fixed-size entry per block with the record's offset
+    and the block hash, so a block is read by height with one index read and
+    one segment seek. Hashes are found through a third file, an
+    open-addressing hash table of heights, so neither offsets nor hashes are
+    held in memory.
+
+    Attributes:
+    -----------
+    path : str
+        The path of the segment file; the index is stored at path + '.idx'
+        and the hash table at path + '.hash'.
+    sync : bool
+        Whether every append is flushed to disk with fsync.
+    """
+
+    def __init__(self, path: str, sync: bool = False) -> None:
+        """
+        Open (or create) a block store and recover from an interrupted append.
+
+        Parameters:
+        -----------
+        path : str
+            The path of the segment file.
+        sync : bool
+            Whether every append is flushed to disk with fsync.
+        """
+        self.path: str = path
+        self.sync: bool = sync
+        self._count = 0
+        self._capacity = 0
+        self._segment = open(path, 'a+b')
+        self._index = open(path + '.idx', 'a+b')
+        self._hashes = open(path + '.hash', 'r+b' if os.path.exists(path + '.hash') else 'w+b')
+        self._recover()
+
+    def _recover(self) -> None:
+        """
+        Make the index and hash table consistent with the segment file.
+
+        Torn index entries and index entries past the end of the segment are
+        dropped, a torn record at the end of the segment is truncated, and
+        complete records missing from the index are re-indexed. The hash table
+        is rebuilt from the index if it does not cover exactly its entries.
+        """
+        index_size = os.fstat(self._index.fileno()).st_size
+        segment_size = os.fstat(self._segment.fileno()).st_size
+        count = index_size // INDEX_ENTRY.size
+        end = 0
+        while count:
+            # Offsets only grow, so the entries to drop are all at the end
+            offset, _ = self._entry(count - 1)
+            if offset + RECORD_HEADER.size <= segment_size:
+                self._segment.seek(offset)
+                (body_size,) = RECORD_HEADER.unpack(self._segment.read(RECORD_HEADER.size))
+                end = offset + RECORD_HEADER.size + body_size
+                if end <= segment_size:
+                    break
+            count -= 1
+            end = 0
+        self._count = count
+        self._index.truncate(count * INDEX_ENTRY.size)
+
+        self._hashes.seek(0)
+        header = self._hashes.read(HASH_HEADER.size)
+        table_size = os.fstat(self._hashes.fileno()).st_size - HASH_HEADER.size
+        if len(header) == HASH_HEADER.size and HASH_HEADER.unpack(header)[0] == count:
+            self._capacity = table_size // HASH_SLOT.size
+        else:
+            self._rebuild_hashes(max(HASH_TABLE_MIN, 1 << (2 * count).bit_length()))
+
+        self._segment.seek(end)
+        while True:
+            header = self._segment.read(RECORD_HEADER.size)
+            if len(header) < RECORD_HEADER.size:
+                break
+            (body_size,) = RECORD_HEADER.unpack(header)
+            body = self._segment.read(body_size)
+            if len(body) < body_size:
+                break
+            self._index_record(end, _decode_block(body).hash)
+            end += RECORD_HEADER.size + body_size
+        self._segment.truncate(end)
+        self._flush()
+
+    def _entry(self, height: int) -> tuple[int, bytes]:
+        """
+        Read the (offset, raw hash) index entry of a height.
+        """
+        self._index.seek(height * INDEX_ENTRY.size)
+        return INDEX_ENTRY.unpack(self._index.read(INDEX_ENTRY.size))
+
+    def _slot(self, position: int) -> int:
+        """
+        Read a hash table slot: 0 when empty, otherwise the height plus one.
+        """
+        self._hashes.seek(HASH_HEADER.size + position * HASH_SLOT.size)
+        return HASH_SLOT.unpack(self._hashes.read(HASH_SLOT.size))[0]
+
+    def _insert_hash(self, raw_hash: bytes, height: int) -> None:
+        """
+        Store a height in the first free slot of its probe sequence.
+        """
+        # Block hashes are uniformly distributed, so their leading bytes serve as the slot hash
+        mask = self._capacity - 1
+        position = int.from_bytes(raw_hash[:8], 'big') & mask
+        while self._slot(position):
+            position = (position + 1) & mask
+        self._hashes.seek(HASH_HEADER.size + position * HASH_SLOT.size)
+        self._hashes.write(HASH_SLOT.pack(height + 1))
+
+    def _rebuild_hashes(self, capacity: int) -> None:
+        """
+        Rewrite the hash table with a new capacity from the index entries.
+        """
+        self._capacity = capacity
+        self._hashes.seek(0)
+        self._hashes.truncate()
+        self._hashes.write(HASH_HEADER.pack(0))
+        empty = bytes(HASH_SLOT.size * HASH_TABLE_MIN)
+        for _ in range(0, capacity, HASH_TABLE_MIN):
+            self._hashes.write(empty)
+        for height in range(self._count):
+            self._insert_hash(self._entry(height)[1], height)
+        self._hashes.seek(0)
+        self._hashes.write(HASH_HEADER.pack(self._count))
+
+    def _index_record(self, offset: int, block_hash: str) -> None:
+        raw_hash = bytes.fromhex(block_hash)
+        self._index.seek(0, os.SEEK_END)
+        self._index.write(INDEX_ENTRY.pack(offset, raw_hash))
+        self._count += 1
+        # Keep the table at most half full so that probe sequences stay short
+        if 2 * self._count > self._capacity:
+            self._rebuild_hashes(2 * self._capacity)
+        else:
+            self._insert_hash(raw_hash, self._count - 1)
+            self._hashes.seek(0)
+            self._hashes.write(HASH_HEADER.pack(self._count))
+
+    def _flush(self) -> None:
+        self._segment.flush()
+        self._index.flush()
+        self._hashes.flush()
+        if self.sync:
+            os.fsync(self._segment.fileno())
+            os.fsync(self._index.fileno())
+            os.fsync(self._hashes.fileno())
+
+    def append(self, block: Block) -> None:
+        """
+        Append a block to the end of the store.
+
+        The record is written before its index entry, so a crash between the
+        two leaves a record that is re-indexed on the next open.
+
+        Parameters:
+        -----------
+        block : Block
+            The block to be stored.
+        """
+        self._segment.seek(0, os.SEEK_END)
+        offset = self._segment.tell()
+        self._segment.write(_encode_block(block))
+        self._segment.flush()
+        self._index_record(offset, block.hash)
+        self._flush()
+
+    def __len__(self) -> int:
+        """
+        Return the number of stored blocks.
+        """
+        return self._count
+
+    def __getitem__(self, height: int) -> Block:
+        """
+        Read the block at a height; negative heights count from the end.
+
+        Parameters:
+        -----------
+        height : int
+            The height of the block.
+
+        Returns:
+        --------
+        Block
+            The stored block.
+        """
+        if height < 0:
+            height += self._count
+        if not 0 <= height < self._count:
+            raise IndexError("block height out of range")
+        self._segment.seek(self._entry(height)[0])
+        (body_size,) = RECORD_HEADER.unpack(self._segment.read(RECORD_HEADER.size))
+        return _decode_block(self._segment.read(body_size))
+
+    def find(self, block_hash: str) -> Optional[Block]:
+        """
+        Read the block with a given hash.
+
+        Parameters:
+        -----------
+        block_hash : str
+            The hash of the block.
+
+        Returns:
+        --------
+        Optional[Block]
+            The stored block, or None if no block has that hash.
+        """
+        try:
+            raw_hash = bytes.fromhex(block_hash)
+        except ValueError:
+            return None
+        mask = self._capacity - 1
+        position = int.from_bytes(raw_hash[:8], 'big') & mask
+        while True:
+            slot = self._slot(position)
+            if not slot:
+                return None
+            if self._entry(slot - 1)[1] == raw_hash:
+                return self[slot - 1]
+            position = (position + 1) & mask
+
+    def iter_from(self, height: int = 0) -> Iterator[Block]:
+        """
+        Stream the blocks from a height to the end of the store.
+
+        Parameters:
+        -----------
+        height : int
+            The height of the first block to read.
+
+        Yields:
+        -------
+        Block
+            The stored blocks, in order.
+        """
+        if height >= self._count:
+            return
+        count = self._count - height
+        with open(self.path, 'rb') as segment:
+            segment.seek(self._entry(height)[0])
+            for _ in range(count):
+                (body_size,) = RECORD_HEADER.unpack(segment.read(RECORD_HEADER.size))
+                yield _decode_block(segment.read(body_size))
+
+    def __iter__(self) -> Iterator[Block]:
+        """
+        Stream every stored block in order.
+        """
+        return self.iter_from(0)
+
+    def close(self) -> None:
+        """
+        Flush and close the segment and index files.
+        """
+        self._flush()
+        self._segment.close()
+        self._index.close()
+        self._hashes.close()
+
+
 class Blockchain:
     """
     A class to represent a blockchain.
 
     Attributes:
     -----------
-    chain : list[Block]
-        The list of blocks in the blockchain.
+    chain : Union[list[Block], BlockStore]
+        The blocks in the blockchain, in memory or in a BlockStore.
+    validated_height : int
+        The number of leading blocks already checked by validate().
+    difficulty : int
+        The proof-of-work difficulty of new blocks; 0 disables mining.
+    workers : int
+        The number of processes used to mine new blocks.
     """
 
-    def __init__(self) -> None:
+    def __init__(self, store: Optional[BlockStore] = None, difficulty: int = 0, workers: int = 1) -> None:
         """
         Constructs all the necessary attributes for the Blockchain object.
+
+        Parameters:
+        -----------
+        store : Optional[BlockStore]
+            A persistent store to keep the blocks in. When omitted the blocks
+            are kept in an in-memory list.
+        difficulty : int
+            The number of leading zero bits new blocks must be mined to.
+        workers : int
+            The number of processes used to mine new blocks.
         """
-        self.genesis_block = None
-        self.chain = []
+        self.chain: Union[list[Block], BlockStore] = [] if store is None else store
+        self.genesis_block = self.chain[0] if len(self.chain) else None
+        self.validated_height = 0
+        self.difficulty = difficulty
+        self.workers = workers
 
 
     def create_genesis_block(self) -> None:
@@ -103,10 +1040,91 @@ class Blockchain:
         if self.genesis_block is None:
             self.create_genesis_block()
         last_block = self.chain[-1]
-        new_block = Block(datetime.datetime.now(), data, last_block.calc_hash())
+        if self.difficulty:
+            new_block = ProofOfWorkBlock(datetime.datetime.now(), data, last_block.hash,
+                                         self.difficulty, self.workers)
+        else:
+            new_block = Block(datetime.datetime.now(), data, last_block.hash)
         self.chain.append(new_block)
 
 
+    def add_transactions(self, transactions: list[str]) -> None:
+        """
+        Add a new block committing to a list of transactions.
+
+        Parameters:
+        -----------
+        transactions : list[str]
+            The transactions to be stored in the new block.
+
+        Raises:
+        -------
+        ValueError
+            If the chain requires proof of work, which MerkleBlocks do not carry.
+        """
+        if self.difficulty:
+            raise ValueError("transaction blocks cannot be added to a chain that requires proof of work")
+        if self.genesis_block is None:
+            self.create_genesis_block()
+        last_block = self.chain[-1]
+        self.chain.append(MerkleBlock(datetime.datetime.now(), transactions, last_block.hash))
+
+
+    def validate(self, full: bool = False, workers: Optional[int] = None) -> int:
+        """
+        Check that every block's hash matches its contents and links to the
+        hash of the block before it.
+
+        Mined blocks must also satisfy their difficulty, and every block
+        after the genesis block must declare at least the chain's difficulty;
+        blocks that are not mined count as difficulty 0.
+
+        By default only the blocks appended since the last successful
+        validation are checked. With full=True the whole chain is re-hashed,
+        spread over a pool of worker processes when workers is greater
+        than 1, and the links are checked afterwards.
+
+        Parameters:
+        -----------
+        full : bool
+            Re-validate the whole chain instead of only the new blocks.
+        workers : Optional[int]
+            The number of worker processes for a full validation. None or 1
+            hashes in the current process.
+
+        Returns:
+        --------
+        int
+            The index of the first invalid block, or -1 if the chain is valid.
+        """
+        start = 0 if full else self.validated_height
+        blocks = self._iter_blocks(start)
+        if workers is not None and workers > 1:
+            pairs = _hash_in_parallel(blocks, workers)
+        else:
+            pairs = ((block, block.calc_hash()) for block in blocks)
+
+        previous_hash = self.chain[start - 1].hash if start > 0 else "0"
+        for index, (block, block_hash) in enumerate(pairs, start):
+            if (block.hash != block_hash or block.previous_hash != previous_hash
+                    or not block.has_valid_work()
+                    or (index > 0 and getattr(block, 'difficulty', 0) < self.difficulty)):
+                self.validated_height = min(self.validated_height, index)
+                return index
+            previous_hash = block.hash
+
+        self.validated_height = len(self.chain)
+        return -1
+
+    def _iter_blocks(self, start: int) -> Iterator[Block]:
+        """
+        Iterate over the blocks from a height, streaming from a store.
+        """
+        if isinstance(self.chain, BlockStore):
+            return self.chain.iter_from(start)
+        # Index from start rather than islice, which would step over every earlier block
+        return (self.chain[index] for index in range(start, len(self.chain)))
+
     def __repr__(self) -> str:
         """
         Return a string representation of the blockchain.
@@ -116,10 +1134,7 @@ class Blockchain:
         str
             A string representation of the blockchain.
         """
-        chain_str = ""
-        for block in self.chain:
-            chain_str += str(block) + "\n"
-        return chain_str
+        return "".join(str(block) + "\n" for block in self.chain)
 
 if __name__ == "__main__":
     # Test cases
@@ -169,3 +1184,278 @@ if __name__ == "__main__":
     assert len(blockchain.chain) == 2
     print("Test Case 6: Pass")
 
+    #Test Case 7 - A valid chain validates, incrementally and in full
+    blockchain = Blockchain()
+    for i in range(10):
+        blockchain.add_block(f"Block {i} Data")
+    assert blockchain.validate() == -1
+    blockchain.add_block("Block 10 Data")
+    assert blockchain.validate() == -1
+    assert blockchain.validated_height == 12
+    assert blockchain.validate(full=True, workers=2) == -1
+    print("Test Case 7: Pass")
+
+    #Test Case 8 - Tampering is reported at the first broken index
+    # Blocks are immutable, so simulate corruption below the public API
+    object.__setattr__(blockchain.chain[5], "data", "Tampered Data")
+    assert blockchain.validate() == -1  # Block 5 was already validated
+    assert blockchain.validate(full=True) == 5
+    assert blockchain.validate(full=True, workers=2) == 5
+    forged = blockchain.chain[5]
+    blockchain.chain[5] = Block(forged.timestamp, forged.data, forged.previous_hash)
+    assert blockchain.validate(full=True) == 6  # Block 6 no longer links to it
+    print("Test Case 8: Pass")
+
+    #Test Case 9 - Validation throughput on a long chain
+    import os
+    import time
+    blockchain = Blockchain()
+    for i in range(10 ** 5):
+        blockchain.add_block(f"Block {i} Data")
+    start = time.perf_counter()
+    assert blockchain.validate(full=True) == -1
+    serial_time = time.perf_counter() - start
+    start = time.perf_counter()
+    assert blockchain.validate(full=True, workers=os.cpu_count()) == -1
+    parallel_time = time.perf_counter() - start
+    blockchain.add_block("One more block")
+    start = time.perf_counter()
+    assert blockchain.validate() == -1
+    incremental_time = time.perf_counter() - start
+    print(f"Full: {serial_time:.3f}s, parallel ({os.cpu_count()} workers): {parallel_time:.3f}s, "
+          f"incremental: {incremental_time * 1e6:.0f}us")
+    # The parallel path streams many batches and stops at the first bad one
+    object.__setattr__(blockchain.chain[50000], "data", "Tampered Data")
+    assert blockchain.validate(full=True, workers=2) == 50000
+
+    # Incremental validation reads only the new blocks, however long the chain
+    class CountingChain(list):
+        reads = 0
+        def __getitem__(self, index):
+            CountingChain.reads += 1
+            return super().__getitem__(index)
+        def __iter__(self):
+            raise AssertionError("incremental validation walked the whole chain")
+
+    reads = []
+    for length in (10 ** 3, 10 ** 4):
+        blockchain = Blockchain()
+        for i in range(length):
+            blockchain.add_block(f"Block {i} Data")
+        assert blockchain.validate() == -1
+        blockchain.chain = CountingChain(blockchain.chain)
+        blockchain.add_block("One more block")
+        CountingChain.reads = 0
+        assert blockchain.validate() == -1
+        reads.append(CountingChain.reads)
+    assert reads[0] == reads[1] == 2  # the previous block and the new one
+    print("Test Case 9: Pass")
+
+    #Test Case 10 - Blocks cannot be modified after creation
+    block = Block(datetime.datetime.now(), "Data", "0")
+    try:
+        block.data = "Other Data"
+        assert False, "Block should be immutable"
+    except AttributeError:
+        pass
+    assert block.hash == block.calc_hash()
+    print("Test Case 10: Pass")
+
+    #Test Case 11 - Append throughput, reusing the stored hash against
+    # re-hashing the previous block on every append
+    for payload_size, appends in ((16, 10 ** 5), (10 ** 6, 50)):
+        payload = "A" * payload_size
+        blockchain = Blockchain()
+        start = time.perf_counter()
+        for i in range(appends):
+            blockchain.add_block(payload)
+        cached_time = time.perf_counter() - start
+
+        blockchain = Blockchain()
+        blockchain.create_genesis_block()
+        start = time.perf_counter()
+        for i in range(appends):
+            last_block = blockchain.chain[-1]
+            blockchain.chain.append(Block(datetime.datetime.now(), payload, last_block.calc_hash()))
+        rehash_time = time.perf_counter() - start
+        print(f"{payload_size}-char payloads: {appends / cached_time:.0f} appends/s cached, "
+              f"{appends / rehash_time:.0f} appends/s re-hashing")
+    print("Test Case 11: Pass")
+
+    #Test Case 12 - Blocks persist in a BlockStore and survive reopening
+    import tempfile
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "chain.seg")
+        blockchain = Blockchain(BlockStore(path))
+        for i in range(100):
+            blockchain.add_block(f"Block {i} Data")
+        third_block = blockchain.chain[3]
+        blockchain.chain.close()
+
+        blockchain = Blockchain(BlockStore(path))
+        assert len(blockchain.chain) == 101
+        assert blockchain.chain[3].hash == third_block.hash
+        assert blockchain.chain.find(third_block.hash).data == "Block 2 Data"
+        assert blockchain.chain.find("0" * 64) is None
+        assert blockchain.validate() == -1
+        blockchain.chain.close()
+    print("Test Case 12: Pass")
+
+    #Test Case 13 - Crash recovery after a torn append
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "chain.seg")
+        store = BlockStore(path)
+        blockchain = Blockchain(store)
+        for i in range(10):
+            blockchain.add_block(f"Block {i} Data")
+        store.close()
+        # The last record reached the segment but its index entry did not,
+        # and a second append was cut off halfway through its record
+        with open(path + ".idx", "r+b") as index_file:
+            index_file.truncate(10 * INDEX_ENTRY.size)
+        with open(path, "ab") as segment_file:
+            segment_file.write(_encode_block(Block(datetime.datetime.now(), "Lost", "0"))[:20])
+
+        blockchain = Blockchain(BlockStore(path))
+        assert len(blockchain.chain) == 11
+        assert blockchain.chain[-1].data == "Block 9 Data"
+        assert blockchain.validate() == -1
+        blockchain.add_block("Block 10 Data")
+        assert blockchain.validate() == -1
+        blockchain.chain.close()
+    print("Test Case 13: Pass")
+
+    #Test Case 14 - Block store append and read throughput
+    import random
+    with tempfile.TemporaryDirectory() as directory:
+        blocks = 10 ** 4
+        blockchain = Blockchain(BlockStore(os.path.join(directory, "chain.seg")))
+        start = time.perf_counter()
+        for i in range(blocks):
+            blockchain.add_block(f"Block {i} Data")
+        append_time = time.perf_counter() - start
+        start = time.perf_counter()
+        for height in random.sample(range(blocks), 1000):
+            blockchain.chain[height]
+        random_read_time = time.perf_counter() - start
+        sampled = [blockchain.chain[height] for height in random.sample(range(blocks), 1000)]
+        start = time.perf_counter()
+        assert all(blockchain.chain.find(block.hash).data == block.data for block in sampled)
+        find_time = time.perf_counter() - start
+        start = time.perf_counter()
+        streamed = sum(1 for _ in blockchain.chain)
+        scan_time = time.perf_counter() - start
+        assert streamed == blocks + 1
+        print(f"Appends: {blocks / append_time:.0f}/s, random reads: {1000 / random_read_time:.0f}/s, "
+              f"finds by hash: {1000 / find_time:.0f}/s, streamed reads: {streamed / scan_time:.0f}/s")
+        blockchain.chain.close()
+    print("Test Case 14: Pass")
+
+    #Test Case 15 - Merkle inclusion proofs
+    transactions = [f"tx {i}" for i in range(7)]
+    blockchain = Blockchain()
+    blockchain.add_transactions(transactions)
+    block = blockchain.chain[-1]
+    assert block.data == merkle_root(transactions)
+    for i, transaction in enumerate(transactions):
+        assert verify_merkle_proof(transaction, block.merkle_proof(i), block.data)
+    assert not verify_merkle_proof("tx 99", block.merkle_proof(0), block.data)
+    assert MerkleBlock(block.timestamp, [], "0").data == merkle_root([])
+    # An empty block's root is not the root of a single empty transaction
+    assert merkle_root([]) != merkle_root([""])
+    assert not verify_merkle_proof("", [], MerkleBlock(block.timestamp, [], "0").data)
+    assert blockchain.validate(full=True) == -1
+    assert blockchain.validate(full=True, workers=2) == -1
+    object.__setattr__(block, "transactions", ("forged",) + block.transactions[1:])
+    assert blockchain.validate(full=True) == 1
+    print("Test Case 15: Pass")
+
+    #Test Case 16 - MerkleBlocks round-trip through a BlockStore
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "chain.seg")
+        blockchain = Blockchain(BlockStore(path))
+        blockchain.add_transactions(transactions)
+        blockchain.add_block("Plain Data")
+        blockchain.chain.close()
+        blockchain = Blockchain(BlockStore(path))
+        assert blockchain.chain[1].transactions == tuple(transactions)
+        assert verify_merkle_proof("tx 3", blockchain.chain[1].merkle_proof(3), blockchain.chain[1].data)
+        assert blockchain.validate() == -1
+        blockchain.chain.close()
+    print("Test Case 16: Pass")
+
+    #Test Case 17 - Proof generation and verification against re-hashing
+    # the whole block for blocks of 10k records
+    transactions = [f"record {i}: {'x' * 64}" for i in range(10 ** 4)]
+    block = MerkleBlock(datetime.datetime.now(), transactions, "0")
+    start = time.perf_counter()
+    proofs = [block.merkle_proof(i) for i in range(0, len(transactions), 100)]
+    proof_time = (time.perf_counter() - start) / len(proofs)
+    start = time.perf_counter()
+    for i, proof in zip(range(0, len(transactions), 100), proofs):
+        assert verify_merkle_proof(transactions[i], proof, block.data)
+    verify_time = (time.perf_counter() - start) / len(proofs)
+    start = time.perf_counter()
+    for _ in range(10):
+        block.calc_hash()
+    rehash_time = (time.perf_counter() - start) / 10
+    print(f"Proof: {proof_time * 1e6:.1f}us, verify: {verify_time * 1e6:.1f}us, "
+          f"full rehash: {rehash_time * 1e6:.1f}us")
+    print("Test Case 17: Pass")
+
+    #Test Case 18 - Proof-of-work blocks are mined, validated and stored
+    blockchain = Blockchain(difficulty=8)
+    blockchain.add_block("Mined Data")
+    blockchain.add_block("More Mined Data")
+    assert all(block.hash.startswith("00") for block in blockchain.chain[1:])
+    assert blockchain.validate(full=True) == -1
+    assert blockchain.validate(full=True, workers=2) == -1
+    mined = blockchain.chain[1]
+    blockchain.chain[1] = ProofOfWorkBlock.restore_work(mined.timestamp, mined.data, mined.previous_hash,
+                                                        mined.difficulty, mined.nonce + 1, mined.hash)
+    assert blockchain.validate(full=True) == 1
+    parallel_block = ProofOfWorkBlock(datetime.datetime.now(), "Data", "0", 12, workers=2)
+    assert parallel_block.has_valid_work() and parallel_block.hash == parallel_block.calc_hash()
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "chain.seg")
+        store = BlockStore(path)
+        store.append(parallel_block)
+        store.close()
+        store = BlockStore(path)
+        assert store[0].nonce == parallel_block.nonce and store[0].has_valid_work()
+        store.close()
+    # Difficulty and nonce are fixed-width fields, so (1, 23) and (12, 3) differ
+    timestamp = datetime.datetime.now()
+    first = ProofOfWorkBlock.restore_work(timestamp, "Data", "0", 1, 23, "")
+    second = ProofOfWorkBlock.restore_work(timestamp, "Data", "0", 12, 3, "")
+    assert first.calc_hash() != second.calc_hash()
+    # An impossible difficulty is rejected the same way for any worker count
+    for workers in (1, 2):
+        try:
+            mine_nonce(b"Data", 300, workers)
+            assert False, "expected ValueError"
+        except ValueError:
+            pass
+    # A failing worker is reported instead of leaving the parent waiting
+    try:
+        mine_nonce("not bytes", 8, workers=2)
+        assert False, "expected RuntimeError"
+    except RuntimeError as error:
+        assert isinstance(error.__cause__, TypeError)
+    # A block may not declare less work than the chain requires
+    blockchain = Blockchain(difficulty=20)
+    blockchain.create_genesis_block()
+    genesis = blockchain.chain[0]
+    forged = ProofOfWorkBlock(datetime.datetime.now(), "Forged Data", genesis.hash, 0)
+    blockchain.chain.append(forged)
+    assert forged.has_valid_work() and blockchain.validate(full=True) == 1
+    print("Test Case 18: Pass")
+
+    #Test Case 19 - Mining hash rate as the number of worker processes grows
+    attempts = 1 << 18
+    prefix = (str(datetime.datetime.now()) + "Benchmark Data" + "0" + "256").encode('utf-8')
+    for workers in sorted({1, 2, os.cpu_count() or 1}):
+        start = time.perf_counter()
+        assert mine_nonce(prefix, 256, workers, max_nonce=attempts) == -1  # exhausts the range
+        print(f"{workers} worker(s): {attempts / (time.perf_counter() - start):.0f} hashes/s")
+    print("Test Case 19: Pass")
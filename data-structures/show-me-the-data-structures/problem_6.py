@@ -1,4 +1,13 @@
-from typing import Optional
+import itertools
+import os
+import tempfile
+from array import array
+from typing import Iterable, Iterator, Optional, Union
+
+try:
+    import numpy as np
+except ImportError:  # The vectorized set operations are optional
+    np = None
 
 class Node:
     """
@@ -11,6 +20,7 @@ class Node:
     next : Optional[Node]
         The reference to the next node in the linked list.
     """
+    __slots__ = ('value', 'next')
 
     def __init__(self, value: int) -> None:
         """
@@ -44,6 +54,10 @@ class LinkedList:
     -----------
     head : Optional[Node]
         The head node of the linked list.
+    tail : Optional[Node]
+        The last node of the linked list, so appends do not walk the list.
+    length : int
+        The number of nodes in the linked list.
     """
 
     def __init__(self) -> None:
@@ -51,6 +65,41 @@ class LinkedList:
         Constructs all the necessary attributes for the LinkedList object.
         """
         self.head: Optional[Node] = None
+        self.tail: Optional[Node] = None
+        self.length: int = 0
+
+    @classmethod
+    def from_iterable(cls, values: Iterable[int]) -> 'LinkedList':
+        """
+        Build a linked list holding the given values in order.
+
+        Parameters:
+        -----------
+        values : Iterable[int]
+            The values to be stored.
+
+        Returns:
+        --------
+        LinkedList
+            The new linked list.
+        """
+        linked_list = cls()
+        linked_list.extend(values)
+        return linked_list
+
+    def __iter__(self) -> Iterator[int]:
+        """
+        Iterate over the values of the linked list.
+
+        Returns:
+        --------
+        Iterator[int]
+            The values from head to tail.
+        """
+        node = self.head
+        while node:
+            yield node.value
+            node = node.next
 
     def __str__(self) -> str:
         """
@@ -61,12 +110,7 @@ class LinkedList:
         str
             A string representation of the linked list, with nodes separated by " -> ".
         """
-        cur_head: Optional[Node] = self.head
-        out_string: str = ""
-        while cur_head:
-            out_string += str(cur_head.value) + " -> "
-            cur_head = cur_head.next
-        return out_string
+        return "".join(str(value) + " -> " for value in self)
 
     def append(self, value: int) -> None:
         """
@@ -77,81 +121,424 @@ class LinkedList:
         value : int
             The value to be stored in the new node.
         """
-        if self.head is None:
-            self.head = Node(value)
+        node = Node(value)
+        if self.tail is None:
+            self.head = node
+        else:
+            self.tail.next = node
+        self.tail = node
+        self.length += 1
+
+    def extend(self, values: Iterable[int]) -> None:
+        """
+        Append every value of an iterable to the end of the linked list.
+
+        Parameters:
+        -----------
+        values : Iterable[int]
+            The values to be appended, in order.
+        """
+        tail = self.tail
+        added = 0
+        for value in values:
+            node = Node(value)
+            if tail is None:
+                self.head = node
+            else:
+                tail.next = node
+            tail = node
+            added += 1
+        self.tail = tail
+        self.length += added
+
+    def size(self) -> int:
+        """
+        Return the size (number of nodes) of the linked list.
+
+        Returns:
+        --------
+        int
+            The number of nodes in the linked list.
+        """
+        return self.length
+
+    def remove(self, value: int) -> bool:
+        """
+        Remove the first node holding the given value.
+
+        Parameters:
+        -----------
+        value : int
+            The value to be removed.
+
+        Returns:
+        --------
+        bool
+            True if a node was removed, False if the value was not found.
+        """
+        previous: Optional[Node] = None
+        node = self.head
+        while node and node.value != value:
+            previous, node = node, node.next
+        if node is None:
+            return False
+        if previous is None:
+            self.head = node.next
+        else:
+            previous.next = node.next
+        if node is self.tail:
+            self.tail = previous
+        self.length -= 1
+        return True
+
+
+class CompactLinkedList:
+    """
+    A singly linked list of integers stored in parallel arrays.
+
+    Node i is the pair values[i], links[i], where links[i] is the index of
+    the next node or -1. Removed slots are chained into a free list and
+    reused by later appends, so a list costs 16 bytes per element instead
+    of a Python object per node and per value.
+
+    Attributes:
+    -----------
+    values : array
+        The value of each slot, as signed 64-bit integers.
+    links : array
+        The index of the next node of each slot, or -1.
+    head : int
+        The index of the first node, or -1 if the list is empty.
+    tail : int
+        The index of the last node, or -1 if the list is empty.
+    length : int
+        The number of nodes in the linked list.
+    free : int
+        The index of the first reusable slot, or -1.
+    """
+
+    def __init__(self) -> None:
+        """
+        Constructs all the necessary attributes for the CompactLinkedList object.
+        """
+        self.values: array = array('q')
+        self.links: array = array('q')
+        self.head: int = -1
+        self.tail: int = -1
+        self.length: int = 0
+        self.free: int = -1
+        # True while nodes sit in slot order 0..length-1, as after only appends
+        self._in_slot_order: bool = True
+
+    @classmethod
+    def from_iterable(cls, values: Iterable[int]) -> 'CompactLinkedList':
+        """
+        Build a compact linked list holding the given values in order.
+
+        Parameters:
+        -----------
+        values : Iterable[int]
+            The values to be stored.
+
+        Returns:
+        --------
+        CompactLinkedList
+            The new linked list.
+        """
+        linked_list = cls()
+        linked_list.extend(values)
+        return linked_list
+
+    def __iter__(self) -> Iterator[int]:
+        """
+        Iterate over the values of the linked list.
+
+        Returns:
+        --------
+        Iterator[int]
+            The values from head to tail.
+        """
+        if self._in_slot_order:
+            yield from self.values
             return
+        values, links = self.values, self.links
+        index = self.head
+        while index != -1:
+            yield values[index]
+            index = links[index]
 
-        node: Node = self.head
-        while node.next:
-            node = node.next
+    def __str__(self) -> str:
+        """
+        Return a string representation of the linked list.
 
-        node.next = Node(value)
+        Returns:
+        --------
+        str
+            The values of the linked list, with nodes separated by " -> ".
+        """
+        return "".join(str(value) + " -> " for value in self)
+
+    def _link(self, index: int) -> None:
+        if self.tail == -1:
+            self.head = index
+        else:
+            self.links[self.tail] = index
+        self.tail = index
+        self.length += 1
+
+    def append(self, value: int) -> None:
+        """
+        Append a new node with the given value to the end of the linked list.
+
+        Parameters:
+        -----------
+        value : int
+            The value to be stored in the new node.
+        """
+        if self.free != -1:
+            index = self.free
+            self.free = self.links[index]
+            self.values[index] = value
+            self.links[index] = -1
+            self._in_slot_order = False
+        else:
+            index = len(self.values)
+            self.values.append(value)
+            self.links.append(-1)
+        self._link(index)
+
+    def extend(self, values: Iterable[int]) -> None:
+        """
+        Append every value of an iterable to the end of the linked list.
+
+        While there are no free slots the values are copied into the arrays
+        in bulk and linked in slot order.
+
+        Parameters:
+        -----------
+        values : Iterable[int]
+            The values to be appended, in order.
+        """
+        if self.free != -1:
+            for value in values:
+                self.append(value)
+            return
+        first = len(self.values)
+        if np is not None and isinstance(values, np.ndarray):
+            self.values.frombytes(values.astype(np.int64, copy=False).tobytes())
+        else:
+            self.values.extend(values)
+        last = len(self.values)
+        if last == first:
+            return
+        self.links.extend(range(first + 1, last + 1))
+        self.links[last - 1] = -1
+        if self.tail == -1:
+            self.head = first
+        else:
+            self.links[self.tail] = first
+            self._in_slot_order = self._in_slot_order and self.tail == first - 1
+        self.tail = last - 1
+        self.length += last - first
+
+    def remove(self, value: int) -> bool:
+        """
+        Remove the first node holding the given value, freeing its slot.
+
+        Parameters:
+        -----------
+        value : int
+            The value to be removed.
+
+        Returns:
+        --------
+        bool
+            True if a node was removed, False if the value was not found.
+        """
+        previous, index = -1, self.head
+        while index != -1 and self.values[index] != value:
+            previous, index = index, self.links[index]
+        if index == -1:
+            return False
+        if previous == -1:
+            self.head = self.links[index]
+        else:
+            self.links[previous] = self.links[index]
+        if index == self.tail:
+            self.tail = previous
+        self.links[index] = self.free
+        self.free = index
+        self.length -= 1
+        self._in_slot_order = False
+        return True
 
     def size(self) -> int:
         """
-        Calculate the size (number of nodes) of the linked list.
+        Return the size (number of nodes) of the linked list.
 
         Returns:
         --------
         int
             The number of nodes in the linked list.
         """
-        size: int = 0
-        node: Optional[Node] = self.head
-        while node:
-            size += 1
-            node = node.next
+        return self.length
+
+    def to_numpy(self) -> 'np.ndarray':
+        """
+        Return the values of the linked list as a NumPy int64 array.
+
+        Returns:
+        --------
+        np.ndarray
+            The values from head to tail; a view of the storage while the
+            nodes are in slot order.
+        """
+        if self._in_slot_order:
+            return np.frombuffer(self.values, dtype=np.int64)
+        return np.fromiter(self, dtype=np.int64, count=self.length)
+
+
+AnyLinkedList = Union[LinkedList, CompactLinkedList]
+
+
+def _first_seen_unique(values: 'np.ndarray') -> 'np.ndarray':
+    """
+    Return the distinct values of an array in the order they first appear.
+    """
+    _, first_indices = np.unique(values, return_index=True)
+    return values[np.sort(first_indices)]
+
+
+def _use_numpy(llist_1: AnyLinkedList, llist_2: AnyLinkedList) -> bool:
+    return (np is not None and isinstance(llist_1, CompactLinkedList)
+            and isinstance(llist_2, CompactLinkedList))
+
 
-        return size
+# Marks an exhausted iterator in the sorted merge
+_END = object()
+
+
+def _merge_sorted(llist_1: LinkedList, llist_2: LinkedList, keep_first: bool,
+                  keep_common: bool, keep_second: bool) -> Iterator[int]:
+    """
+    Merge two ascending linked lists, yielding each distinct value once if
+    it is only in the first list, in both, or only in the second list and
+    the matching flag is set.
+    """
+    first, second = iter(llist_1), iter(llist_2)
+    value_1, value_2 = next(first, _END), next(second, _END)
+    while value_1 is not _END or value_2 is not _END:
+        if value_2 is _END or (value_1 is not _END and value_1 < value_2):
+            value, keep = value_1, keep_first
+        elif value_1 is _END or value_2 < value_1:
+            value, keep = value_2, keep_second
+        else:
+            value, keep = value_1, keep_common
+        if keep:
+            yield value
+        # Skip repeated values so each one is considered once
+        while value_1 is not _END and value_1 == value:
+            value_1 = next(first, _END)
+        while value_2 is not _END and value_2 == value:
+            value_2 = next(second, _END)
 
 
-def union(llist_1: LinkedList, llist_2: LinkedList) -> LinkedList:
+def union(llist_1: AnyLinkedList, llist_2: AnyLinkedList, is_sorted: bool = False) -> AnyLinkedList:
     """
     Compute the union of two linked lists.
 
+    Elements keep the order in which they are first seen, the first list
+    before the second. When both lists are sorted in ascending order,
+    is_sorted=True merges them without building a set or dict of the
+    inputs and returns a sorted list. This saves memory rather than time:
+    the merge runs in Python, while hashing runs in C.
+    The result has the type of the first list, and two CompactLinkedLists
+    are combined with vectorized NumPy operations when NumPy is installed.
+
+    Parameters:
+    -----------
+    llist_1 : AnyLinkedList
+        The first linked list.
+    llist_2 : AnyLinkedList
+        The second linked list.
+    is_sorted : bool
+        Whether both linked lists are sorted in ascending order.
+
+    Returns:
+    --------
+    AnyLinkedList
+        A new linked list containing all unique elements from both input linked lists.
+    """
+    if _use_numpy(llist_1, llist_2):
+        values = np.concatenate((llist_1.to_numpy(), llist_2.to_numpy()))
+        return CompactLinkedList.from_iterable(np.unique(values) if is_sorted else _first_seen_unique(values))
+    if is_sorted:
+        return type(llist_1).from_iterable(_merge_sorted(llist_1, llist_2, True, True, True))
+    # A dict keeps unique elements in insertion order
+    return type(llist_1).from_iterable(dict.fromkeys(itertools.chain(llist_1, llist_2)))
+
+
+def intersection(llist_1: AnyLinkedList, llist_2: AnyLinkedList, is_sorted: bool = False) -> AnyLinkedList:
+    """
+    Compute the intersection of two linked lists.
+
+    Elements keep the order in which they are first seen in the first list.
+    The result has the type of the first list, and two CompactLinkedLists
+    are combined with vectorized NumPy operations when NumPy is installed.
+
+    Parameters:
+    -----------
+    llist_1 : AnyLinkedList
+        The first linked list.
+    llist_2 : AnyLinkedList
+        The second linked list.
+    is_sorted : bool
+        Whether both linked lists are sorted in ascending order.
+
+    Returns:
+    --------
+    AnyLinkedList
+        A new linked list containing all elements that are present in both input linked lists.
+    """
+    if _use_numpy(llist_1, llist_2):
+        first, second = llist_1.to_numpy(), llist_2.to_numpy()
+        if is_sorted:
+            return CompactLinkedList.from_iterable(np.intersect1d(first, second))
+        first = _first_seen_unique(first)
+        return CompactLinkedList.from_iterable(first[np.isin(first, second)])
+    if is_sorted:
+        return type(llist_1).from_iterable(_merge_sorted(llist_1, llist_2, False, True, False))
+    second_set = set(llist_2)
+    return type(llist_1).from_iterable(value for value in dict.fromkeys(llist_1) if value in second_set)
+
+
+def difference(llist_1: LinkedList, llist_2: LinkedList, is_sorted: bool = False) -> LinkedList:
+    """
+    Compute the elements of the first linked list that are not in the second.
+
     Parameters:
     -----------
     llist_1 : LinkedList
         The first linked list.
     llist_2 : LinkedList
         The second linked list.
+    is_sorted : bool
+        Whether both linked lists are sorted in ascending order.
 
     Returns:
     --------
     LinkedList
-        A new linked list containing all unique elements from both input linked lists.
+        A new linked list containing the unique elements only present in the first linked list.
     """
-    # Use a set to store all unique elements
-    firs_set = set()
-    second_set = set()
-    if llist_1.head is not None:
-        node = llist_1.head
-        while node:
-            firs_set.add(node.value)
-            node = node.next
-    if llist_2.head is not None:
-        node = llist_2.head
-        while node:
-            second_set.add(node.value)
-            node = node.next
+    if is_sorted:
+        return type(llist_1).from_iterable(_merge_sorted(llist_1, llist_2, True, False, False))
+    second_set = set(llist_2)
+    return type(llist_1).from_iterable(value for value in dict.fromkeys(llist_1) if value not in second_set)
 
-    result_set = set()
-    #add all elements from first set to the result
-    for element_first_set in firs_set:
-        result_set.add(element_first_set)
-    #add all elements from second set to the result
-    for element_second_set in second_set:
-        result_set.add(element_second_set)
-    # Create a new linked list to store the union
-    result = LinkedList()
-    for element in result_set:
-        result.append(element)
-    return result
-
-
-def intersection(llist_1: LinkedList, llist_2: LinkedList) -> LinkedList:
+
+def symmetric_difference(llist_1: LinkedList, llist_2: LinkedList, is_sorted: bool = False) -> LinkedList:
     """
-    Compute the intersection of two linked lists.
+    Compute the elements that are in exactly one of two linked lists.
 
     Parameters:
     -----------
@@ -159,35 +546,255 @@ def intersection(llist_1: LinkedList, llist_2: LinkedList) -> LinkedList:
         The first linked list.
     llist_2 : LinkedList
         The second linked list.
+    is_sorted : bool
+        Whether both linked lists are sorted in ascending order.
 
     Returns:
     --------
     LinkedList
-        A new linked list containing all elements that are present in both input linked lists.
+        A new linked list containing the unique elements present in only one linked list.
     """
-    # Use sets to find the intersection
-    firs_set = set()
-    second_set = set()
-    if llist_1.head is not None:
-        node = llist_1.head
-        while node:
-            firs_set.add(node.value)
-            node = node.next
-    if llist_2.head is not None:
-        node = llist_2.head
-        while node:
-            second_set.add(node.value)
-            node = node.next
+    if is_sorted:
+        return type(llist_1).from_iterable(_merge_sorted(llist_1, llist_2, True, False, True))
+    first = dict.fromkeys(llist_1)
+    second = dict.fromkeys(llist_2)
+    return type(llist_1).from_iterable(itertools.chain((value for value in first if value not in second),
+                                                    (value for value in second if value not in first)))
+
+
+def union_all(llists: Iterable[LinkedList]) -> LinkedList:
+    """
+    Compute the union of any number of linked lists in one pass.
+
+    Parameters:
+    -----------
+    llists : Iterable[LinkedList]
+        The linked lists to combine.
+
+    Returns:
+    --------
+    LinkedList
+        A new linked list with every unique element, in first-seen order.
+    """
+    return LinkedList.from_iterable(dict.fromkeys(itertools.chain.from_iterable(llists)))
+
+
+def intersection_all(llists: Iterable[LinkedList]) -> LinkedList:
+    """
+    Compute the intersection of any number of linked lists in one pass.
+
+    Each element of the first list counts the lists it has been seen in so
+    far; an element only moves forward when it is found in the next list.
+
+    Parameters:
+    -----------
+    llists : Iterable[LinkedList]
+        The linked lists to combine.
+
+    Returns:
+    --------
+    LinkedList
+        A new linked list with the elements present in every linked list, in
+        the order they are first seen in the first one.
+    """
+    llists = iter(llists)
+    first = next(llists, None)
+    if first is None:
+        return LinkedList()
+    seen_in = dict.fromkeys(first, 1)
+    lists_seen = 1
+    for llist in llists:
+        for value in llist:
+            if seen_in.get(value) == lists_seen:
+                seen_in[value] = lists_seen + 1
+        lists_seen += 1
+    return LinkedList.from_iterable(value for value, count in seen_in.items() if count == lists_seen)
+
+# Values buffered per partition before they are written to its spill file
+SPILL_BUFFER = 1 << 16
+MASK_64 = (1 << 64) - 1
 
-    result = LinkedList()
 
-    # Find the intersection of both sets
-    for element_first_set in firs_set:
-        for element_second_set in second_set:
-            if element_first_set == element_second_set:
-                result.append(element_first_set)
+def _mix64(value: int) -> int:
+    """
+    Scramble a 64-bit integer with the splitmix64 finalizer.
+
+    hash() of an int is the int itself, so IDs with a common stride would all
+    land in the same partition; after mixing every input bit affects the high
+    bits of the result.
+    """
+    value = (value + 0x9E3779B97F4A7C15) & MASK_64
+    value = ((value ^ (value >> 30)) * 0xBF58476D1CE4E5B9) & MASK_64
+    value = ((value ^ (value >> 27)) * 0x94D049BB133111EB) & MASK_64
+    return value ^ (value >> 31)
+
+
+class _SpillPartitions:
+    """
+    A set of temporary files that integers are hash-partitioned into.
+
+    Attributes:
+    -----------
+    paths : list[str]
+        The file of each partition.
+    buffers : list[array]
+        The values of each partition not yet written to its file.
+    """
+
+    def __init__(self, directory: str, name: str, count: int) -> None:
+        """
+        Constructs empty partitions inside a directory.
+
+        Parameters:
+        -----------
+        directory : str
+            The directory to create the partition files in.
+        name : str
+            A prefix for the partition file names.
+        count : int
+            The number of partitions.
+        """
+        self.paths: list[str] = [os.path.join(directory, f"{name}-{index}.bin") for index in range(count)]
+        self.buffers: list[array] = [array('q') for _ in range(count)]
+
+    def add(self, value: int) -> None:
+        """
+        Add a value to its partition, writing the buffer out when it is full.
+        """
+        # Scale the mixed value into range, which keeps its high bits
+        index = (_mix64(value & MASK_64) * len(self.paths)) >> 64
+        buffer = self.buffers[index]
+        buffer.append(value)
+        if len(buffer) >= SPILL_BUFFER:
+            self._write(index)
+
+    def _write(self, index: int) -> None:
+        with open(self.paths[index], 'ab') as spill_file:
+            self.buffers[index].tofile(spill_file)
+        self.buffers[index] = array('q')
+
+    def read(self, index: int) -> array:
+        """
+        Load every value of one partition, including unwritten ones.
+        """
+        values = array('q')
+        if os.path.exists(self.paths[index]):
+            with open(self.paths[index], 'rb') as spill_file:
+                values.frombytes(spill_file.read())
+        values.extend(self.buffers[index])
+        return values
+
+
+def stream_union(first: Iterable[int], second: Iterable[int], max_in_memory: int = 10 ** 7,
+                 partitions: int = 64) -> Iterator[int]:
+    """
+    Lazily yield every distinct value of two iterables of integers.
+
+    Values are yielded in first-seen order while at most max_in_memory
+    distinct values have been seen. Past that, the values seen so far and
+    the rest of the input are hash-partitioned into temporary files, and the
+    partitions are deduplicated one at a time, so memory is bounded by the
+    largest partition. Values from the partitions are yielded in no
+    particular order.
+
+    Parameters:
+    -----------
+    first : Iterable[int]
+        The first input.
+    second : Iterable[int]
+        The second input.
+    max_in_memory : int
+        The number of distinct values to hold before spilling to disk.
+    partitions : int
+        The number of partitions to spill into.
+
+    Yields:
+    -------
+    int
+        Each distinct value of the inputs, once.
+    """
+    values = itertools.chain(first, second)
+    seen = set()
+    for value in values:
+        if value not in seen:
+            seen.add(value)
+            yield value
+            if len(seen) > max_in_memory:
+                break
+    else:
+        return
+
+    with tempfile.TemporaryDirectory() as directory:
+        emitted = _SpillPartitions(directory, "emitted", partitions)
+        for value in seen:
+            emitted.add(value)
+        seen = None
+        pending = _SpillPartitions(directory, "pending", partitions)
+        for value in values:
+            pending.add(value)
+        for index in range(partitions):
+            partition_seen = set(emitted.read(index))
+            for value in pending.read(index):
+                if value not in partition_seen:
+                    partition_seen.add(value)
+                    yield value
+
+
+def stream_intersection(first: Iterable[int], second: Iterable[int], max_in_memory: int = 10 ** 7,
+                        partitions: int = 64) -> Iterator[int]:
+    """
+    Lazily yield every distinct value present in both iterables of integers.
+
+    The second input is loaded into a set and the first one is streamed
+    against it, yielding values in first-seen order. If the second input has
+    more than max_in_memory distinct values, both inputs are
+    hash-partitioned into temporary files instead and matched one partition
+    at a time, in no particular order.
+
+    Parameters:
+    -----------
+    first : Iterable[int]
+        The first input, which is only read once.
+    second : Iterable[int]
+        The second input.
+    max_in_memory : int
+        The number of distinct values to hold before spilling to disk.
+    partitions : int
+        The number of partitions to spill into.
+
+    Yields:
+    -------
+    int
+        Each distinct value present in both inputs, once.
+    """
+    second = iter(second)
+    second_set = set()
+    for value in second:
+        second_set.add(value)
+        if len(second_set) > max_in_memory:
+            break
+    else:
+        for value in first:
+            if value in second_set:
+                second_set.discard(value)
+                yield value
+        return
+
+    with tempfile.TemporaryDirectory() as directory:
+        second_partitions = _SpillPartitions(directory, "second", partitions)
+        for value in itertools.chain(second_set, second):
+            second_partitions.add(value)
+        second_set = None
+        first_partitions = _SpillPartitions(directory, "first", partitions)
+        for value in first:
+            first_partitions.add(value)
+        for index in range(partitions):
+            partition_set = set(second_partitions.read(index))
+            for value in first_partitions.read(index):
+                if value in partition_set:
+                    partition_set.discard(value)
+                    yield value
 
-    return result
 
 if __name__ == "__main__":
     ## Test case 1
@@ -204,7 +811,7 @@ if __name__ == "__main__":
         linked_list_2.append(i)
 
     print("Test Case 1:")
-    print("Union:", union(linked_list_1, linked_list_2)) # Expected: 1, 2, 3, 4, 6, 9, 11, 21, 32, 35, 65
+    print("Union:", union(linked_list_1, linked_list_2)) # Expected: 3, 2, 4, 35, 6, 65, 21, 32, 9, 1, 11
     print("Intersection:", intersection(linked_list_1, linked_list_2)) # Expected: 4, 6, 21
 
     ## Test case 2
@@ -221,7 +828,7 @@ if __name__ == "__main__":
         linked_list_4.append(i)
 
     print("\nTest Case 2:")
-    print("Union:", union(linked_list_3, linked_list_4)) # Expected: 1, 2, 3, 4, 6, 7, 8, 9, 11, 21, 23, 35, 65
+    print("Union:", union(linked_list_3, linked_list_4)) # Expected: 3, 2, 4, 35, 6, 65, 23, 1, 7, 8, 9, 11, 21
     print("Intersection:", intersection(linked_list_3, linked_list_4)) # Expected: empty
 
     ## Test case 3 -  empty linked list Union
@@ -254,3 +861,190 @@ if __name__ == "__main__":
         llist_2.append(i)
     print("Union:", union(llist_1, llist_2))  # Expected: 1, 2, 3
     print("Intersection", intersection(llist_1, llist_2))  # Expected: 1, 2, 3
+
+    #Test case 7 - Tail pointer and cached size stay consistent
+    print("#Test case 7 - Tail pointer and cached size")
+    llist = LinkedList.from_iterable([1, 2])
+    llist.append(3)
+    llist.extend([4, 5])
+    print(llist, llist.size())  # Expected: 1 -> 2 -> 3 -> 4 -> 5 ->  5
+    print(list(llist) == [1, 2, 3, 4, 5])  # Expected: True
+
+    #Test case 8 - Building and combining 10**5-element lists, against the
+    # previous append that walked from head on every call
+    import time
+
+    def walking_append(linked_list: LinkedList, value: int) -> None:
+        if linked_list.head is None:
+            linked_list.head = Node(value)
+            return
+        node = linked_list.head
+        while node.next:
+            node = node.next
+        node.next = Node(value)
+
+    print("#Test case 8 - Performance")
+    walk_size = 5 * 10 ** 3
+    start = time.perf_counter()
+    walked = LinkedList()
+    for i in range(walk_size):
+        walking_append(walked, i)
+    walk_time = time.perf_counter() - start
+    start = time.perf_counter()
+    appended = LinkedList()
+    for i in range(walk_size):
+        appended.append(i)
+    append_time = time.perf_counter() - start
+    print(f"{walk_size} appends: walking {walk_time:.3f}s, tail pointer {append_time:.4f}s")
+
+    size = 10 ** 5
+    llist_1 = LinkedList.from_iterable(range(size))
+    llist_2 = LinkedList.from_iterable(range(size // 2, size + size // 2))
+    start = time.perf_counter()
+    result = union(llist_1, llist_2)
+    print(f"Union of {size}-element lists: {time.perf_counter() - start:.3f}s")
+    print(result.size() == size + size // 2)  # Expected: True
+
+    #Test case 9 - Difference, symmetric difference and n-ary forms
+    print("#Test case 9 - Difference, symmetric difference and n-ary forms")
+    llist_1 = LinkedList.from_iterable([3, 2, 4, 35, 6, 65, 6, 4, 3, 21])
+    llist_2 = LinkedList.from_iterable([6, 32, 4, 9, 6, 1, 11, 21, 1])
+    print("Difference:", difference(llist_1, llist_2))  # Expected: 3 -> 2 -> 35 -> 65 ->
+    print("Symmetric difference:", symmetric_difference(llist_1, llist_2))
+    # Expected: 3 -> 2 -> 35 -> 65 -> 32 -> 9 -> 1 -> 11 ->
+    llist_3 = LinkedList.from_iterable([21, 4, 100])
+    print("Union all:", union_all([llist_1, llist_2, llist_3]))
+    # Expected: 3 -> 2 -> 4 -> 35 -> 6 -> 65 -> 21 -> 32 -> 9 -> 1 -> 11 -> 100 ->
+    print("Intersection all:", intersection_all([llist_1, llist_2, llist_3]))  # Expected: 4 -> 21 ->
+
+    #Test case 10 - The sorted merge matches the hashing path
+    print("#Test case 10 - Sorted merge")
+    sorted_1 = LinkedList.from_iterable([1, 1, 2, 4, 6, 6, 9])
+    sorted_2 = LinkedList.from_iterable([2, 3, 4, 4, 9, 10])
+    for operation in (union, intersection, difference, symmetric_difference):
+        print(operation.__name__, list(operation(sorted_1, sorted_2, is_sorted=True))
+              == sorted(operation(sorted_1, sorted_2)))  # Expected: True
+
+    #Test case 11 - Set algebra against the previous set-copying union and
+    # nested-loop intersection
+    def set_copy_union(llist_1: LinkedList, llist_2: LinkedList) -> LinkedList:
+        result_set = set()
+        for element in set(llist_1):
+            result_set.add(element)
+        for element in set(llist_2):
+            result_set.add(element)
+        return LinkedList.from_iterable(result_set)
+
+    def nested_loop_intersection(llist_1: LinkedList, llist_2: LinkedList) -> LinkedList:
+        result = LinkedList()
+        for element_first_set in set(llist_1):
+            for element_second_set in set(llist_2):
+                if element_first_set == element_second_set:
+                    result.append(element_first_set)
+        return result
+
+    print("#Test case 11 - Set algebra performance")
+    for size in (2 * 10 ** 3, 10 ** 5):
+        llist_1 = LinkedList.from_iterable(range(size))
+        llist_2 = LinkedList.from_iterable(range(size // 2, size + size // 2))
+        timings = []
+        operations = [("set-copy union", set_copy_union), ("union", union),
+                      ("union (sorted)", lambda a, b: union(a, b, is_sorted=True)),
+                      ("intersection", intersection),
+                      ("intersection (sorted)", lambda a, b: intersection(a, b, is_sorted=True))]
+        if size <= 2 * 10 ** 3:
+            operations.insert(3, ("nested-loop intersection", nested_loop_intersection))
+        for name, operation in operations:
+            start = time.perf_counter()
+            operation(llist_1, llist_2)
+            timings.append(f"{name} {time.perf_counter() - start:.4f}s")
+        print(f"{size} elements: " + ", ".join(timings))
+
+    # The sorted merge is not faster than hashing, but it needs no set or
+    # dict of the inputs: compare the peak memory beyond the result list
+    import tracemalloc
+    llist_1 = LinkedList.from_iterable(range(10 ** 5))
+    llist_2 = LinkedList.from_iterable(range(10 ** 5 // 2, 10 ** 5 + 10 ** 5 // 2))
+    for name, operation in (("union", union), ("intersection", intersection)):
+        overheads = []
+        for is_sorted in (False, True):
+            tracemalloc.start()
+            result = operation(llist_1, llist_2, is_sorted=is_sorted)
+            result_bytes, peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+            del result
+            overheads.append(peak - result_bytes)
+        print(f"{name}: hashing {overheads[0] / 1024:.0f} KiB, sorted merge {overheads[1] / 1024:.0f} KiB "
+              f"extra peak memory", overheads[1] * 10 < overheads[0])  # Expected: True
+
+    #Test case 12 - CompactLinkedList matches LinkedList and reuses slots
+    print("#Test case 12 - CompactLinkedList")
+    compact_1 = CompactLinkedList.from_iterable([3, 2, 4, 35, 6, 65, 6, 4, 3, 21])
+    compact_2 = CompactLinkedList.from_iterable([6, 32, 4, 9, 6, 1, 11, 21, 1])
+    print("Union:", union(compact_1, compact_2))
+    # Expected: 3 -> 2 -> 4 -> 35 -> 6 -> 65 -> 21 -> 32 -> 9 -> 1 -> 11 ->
+    print("Intersection:", intersection(compact_1, compact_2))  # Expected: 4 -> 6 -> 21 ->
+    compact_1.remove(35)
+    compact_1.append(100)
+    print(compact_1, compact_1.size(), len(compact_1.values))
+    # Expected: 3 -> 2 -> 4 -> 6 -> 65 -> 6 -> 4 -> 3 -> 21 -> 100 ->  10 10
+    print("Union:", union(compact_1, compact_2))
+    # Expected: 3 -> 2 -> 4 -> 6 -> 65 -> 21 -> 100 -> 32 -> 9 -> 1 -> 11 ->
+    llist = LinkedList.from_iterable([1, 2, 3])
+    print(llist.remove(3), llist.remove(7), llist, llist.tail)  # Expected: True False 1 -> 2 ->  2
+
+    #Test case 13 - Memory per element and set operation throughput for
+    # both representations
+    import tracemalloc
+    print("#Test case 13 - Representation performance")
+    size = 10 ** 5
+    for representation in (LinkedList, CompactLinkedList):
+        tracemalloc.start()
+        llist_1 = representation.from_iterable(range(10 ** 6, 10 ** 6 + size))
+        memory, _ = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        llist_2 = representation.from_iterable(range(10 ** 6 + size // 2, 10 ** 6 + size + size // 2))
+        start = time.perf_counter()
+        union(llist_1, llist_2)
+        union_time = time.perf_counter() - start
+        start = time.perf_counter()
+        intersection(llist_1, llist_2)
+        intersection_time = time.perf_counter() - start
+        print(f"{representation.__name__}: {memory / size:.1f} bytes/element, "
+              f"union {size / union_time:.0f} elements/s, intersection {size / intersection_time:.0f} elements/s")
+
+    #Test case 14 - Streaming union and intersection, in memory and spilled
+    print("#Test case 14 - Streaming set operations")
+    first_ids = [5, 3, 5, 8, 1, 9, 3, 12]
+    second_ids = [9, 7, 5, 7, 2]
+    print(list(stream_union(iter(first_ids), iter(second_ids))))  # Expected: [5, 3, 8, 1, 9, 12, 7, 2]
+    print(list(stream_intersection(iter(first_ids), iter(second_ids))))  # Expected: [5, 9]
+    spilled_union = list(stream_union(iter(first_ids), iter(second_ids), max_in_memory=2, partitions=3))
+    print(sorted(spilled_union), len(spilled_union))  # Expected: [1, 2, 3, 5, 7, 8, 9, 12] 8
+    print(sorted(stream_intersection(iter(first_ids), iter(second_ids), max_in_memory=2, partitions=3)))
+    # Expected: [5, 9]
+    print(list(stream_union(LinkedList.from_iterable([1, 2]), CompactLinkedList.from_iterable([2, 3]))))
+    # Expected: [1, 2, 3]
+    # Strided IDs are spread evenly over the spill partitions
+    with tempfile.TemporaryDirectory() as directory:
+        balance = _SpillPartitions(directory, "balance", 64)
+        for value in range(0, 64 * 64000, 64):
+            balance.add(value)
+        sizes = [len(balance.read(index)) for index in range(64)]
+    print(max(sizes) < 1.1 * 1000, min(sizes) > 0.9 * 1000)  # Expected: True True
+
+    #Test case 15 - Streaming throughput in memory and with partitions spilled to disk
+    size = 10 ** 6
+    first_ids = range(0, 2 * size, 2)
+    second_ids = range(0, 3 * size, 3)
+    expected_union = len(set(first_ids) | set(second_ids))
+    expected_intersection = len(set(first_ids) & set(second_ids))
+    for max_in_memory in (10 ** 7, size // 10):
+        start = time.perf_counter()
+        union_count = sum(1 for _ in stream_union(first_ids, second_ids, max_in_memory))
+        union_time = time.perf_counter() - start
+        start = time.perf_counter()
+        intersection_count = sum(1 for _ in stream_intersection(first_ids, second_ids, max_in_memory))
+        intersection_time = time.perf_counter() - start
+        print(f"max_in_memory={max_in_memory}: union {union_time:.2f}s, intersection {intersection_time:.2f}s",
+              union_count == expected_union and intersection_count == expected_intersection)